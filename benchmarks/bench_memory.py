@@ -0,0 +1,83 @@
+"""
+Measure the memory per model instance, slotted versus a `__dict__` baseline.
+
+Run from the repository root:
+
+```
+python benchmarks/bench_memory.py --n 1000000
+```
+"""
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from typing import Any, Callable
+
+from pysurvey import OpenRange, Question, Response
+from pysurvey.logic.respondee import Respondee, RespondeeSurvey
+from pysurvey.logic.survey import make_dummy_survey
+
+
+def dict_baseline(cls: type) -> type:
+    """A plain `@dataclass` with the same fields as `cls`, but no slots."""
+    return make_dataclass(
+        f"{cls.__name__}Dict",
+        [
+            (f.name, f.type, field(default=f.default, init=f.init))
+            for f in fields(cls)
+        ],
+    )
+
+
+def measure(factory: Callable[[int], Any], n: int) -> float:
+    """Get the traced bytes per object for `n` objects created by `factory`."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory(i) for i in range(n)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Do not count the list holding the objects.
+    size = after - before - objects.__sizeof__()
+    del objects
+    return size / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=1_000_000)
+    n = parser.parse_args().n
+
+    # Shared field values, so that only the instances themselves are measured.
+    survey = make_dummy_survey()
+    responses = [Response(msg="response", score=1)]
+    rows = [[0, 0, 0], [1, 1, 1]]
+
+    def respondee_survey(cls: type) -> Callable[[int], Any]:
+        def factory(i: int) -> Any:
+            record = cls(respondee=None, survey=survey, responses=rows[i % 2])
+            record.score = 0
+            return record
+
+        return factory
+
+    cases = {
+        OpenRange: lambda cls: lambda i: cls(msg="msg", lower=0, higher=1),
+        Response: lambda cls: lambda i: cls(msg="msg", score=1),
+        Question: lambda cls: lambda i: cls(msg="msg", responses=responses),
+        Respondee: lambda cls: lambda i: cls(name="name", age=30),
+        RespondeeSurvey: respondee_survey,
+    }
+    print(f"{'class':<16} {'dict B/obj':>12} {'slots B/obj':>12} {'saved':>8}")
+    for cls, make in cases.items():
+        baseline = measure(make(dict_baseline(cls)), n)
+        slotted = measure(make(cls), n)
+        print(
+            f"{cls.__name__:<16} {baseline:>12.1f} {slotted:>12.1f}"
+            f" {1 - slotted / baseline:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,35 @@
 __all__ = [
+    # .batch
+    "Aggregator",
+    "BatchError",
+    "BatchJob",
+    "ScoreSummary",
+    # .builder
+    "SurveyBuilder",
+    # .columnar
+    "ColumnarArchive",
+    "NpyColumn",
+    "NpyWriter",
+    "export_columns",
+    # .dedup
+    "BloomFilter",
+    "DuplicateFilter",
+    "ScalableBloomFilter",
+    # .item_stats
+    "ItemStatistics",
+    # .journal
+    "Journal",
+    "JournalError",
+    "read_journal",
     # .json_serializable
     "JsonSerializable",
+    # .label_index
+    "IngestResult",
+    "LabelIndex",
+    # .loader
+    "LoadResult",
+    "load_surveys",
+    "survey_fingerprint",
     # .qanda
     "HasMessage",
     "Numeric",
@@ -8,20 +37,91 @@ __all__ = [
     "Response",
     "Question",
     "QuestionError",
+    # .rank
+    "RankIndex",
+    # .reband
+    "Rebander",
+    "reband_columns",
+    "reband_records",
+    "reband_totals",
+    # .sampling
+    "ReservoirSampler",
+    "StratifiedSampler",
+    "by_range",
+    "by_response",
+    # .shared
+    "AggregateSnapshot",
+    "FrozenSurvey",
+    "ShardedAggregator",
+    # .simulation
+    "SimulationReport",
+    "random_survey",
+    "response_stream",
+    "simulate",
     # .survey
     "RangeError",
+    "Subscale",
+    "SubscaleScore",
     "Survey",
     "SurveyError",
+    # .validation
+    "RowIssue",
+    "ValidationIssue",
+    "ValidationResult",
+    "validate_rows",
 ]
 from .logic import (
+    Aggregator,
+    BatchError,
+    BatchJob,
+    ScoreSummary,
+    SurveyBuilder,
+    ColumnarArchive,
+    NpyColumn,
+    NpyWriter,
+    export_columns,
+    BloomFilter,
+    DuplicateFilter,
+    ScalableBloomFilter,
+    ItemStatistics,
+    Journal,
+    JournalError,
+    read_journal,
     JsonSerializable,
+    IngestResult,
+    LabelIndex,
+    LoadResult,
+    load_surveys,
+    survey_fingerprint,
     HasMessage,
     Numeric,
     Response,
     Question,
     QuestionError,
     OpenRange,
+    RankIndex,
+    Rebander,
+    reband_columns,
+    reband_records,
+    reband_totals,
+    ReservoirSampler,
+    StratifiedSampler,
+    by_range,
+    by_response,
+    AggregateSnapshot,
+    FrozenSurvey,
+    ShardedAggregator,
+    SimulationReport,
+    random_survey,
+    response_stream,
+    simulate,
     RangeError,
+    Subscale,
+    SubscaleScore,
     Survey,
     SurveyError,
+    RowIssue,
+    ValidationIssue,
+    ValidationResult,
+    validate_rows,
 )
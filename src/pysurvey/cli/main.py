@@ -1,5 +1,7 @@
-from typing import Any, Sequence
+import argparse
+from typing import Any, Optional, Sequence
 import pysurvey
+from pysurvey.cli import score as score_cli
 
 
 class ParsingError(Exception): ...
@@ -69,10 +71,22 @@ def survey(survey: pysurvey.Survey, one_based_index: bool = True, sep="-"):
     print("Your result:", survey.get_range(score=score).msg)
 
 
-def main():
-    survey_ = pysurvey.Survey.read_json("./resources/quiz_01.json")
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="pysurvey")
+    subparsers = parser.add_subparsers(dest="command")
+    run = subparsers.add_parser("run", help="take a survey interactively")
+    run.add_argument("survey", nargs="?", default="./resources/quiz_01.json")
+    score_cli.add_parser(subparsers)
+    args = parser.parse_args(argv)
+
+    if args.command == "score":
+        return score_cli.main(args)
+    survey_ = pysurvey.Survey.read_json(
+        getattr(args, "survey", "./resources/quiz_01.json")
+    )
     survey(survey=survey_)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,303 @@
+"""`score`: non-interactive batch scoring of response rows."""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Iterable, Iterator, Optional, Sequence, TextIO
+
+import pysurvey
+
+FORMATS = ("jsonl", "csv")
+
+# The survey used by worker processes, set once by `_init_worker`.
+_SURVEY: Optional[pysurvey.Survey] = None
+
+
+class RowError(Exception): ...
+
+
+def parse_jsonl_row(line: str) -> list[int]:
+    """
+    Parse one `JSONL` line: either a list of response indices or an object
+    with a `responses` key, such as a serialized `RespondeeSurvey`.
+    """
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise RowError(f"invalid JSON: {e}")
+    if isinstance(row, dict):
+        row = row.get("responses")
+    if not isinstance(row, list):
+        raise RowError("expected a list of response indices", line)
+    return row
+
+
+def parse_csv_row(row: Sequence[str]) -> list[int]:
+    try:
+        return [int(cell) for cell in row]
+    except ValueError as e:
+        raise RowError(f"invalid response index: {e}")
+
+
+def read_rows(
+    stream: TextIO, format: str, header: bool = False
+) -> Iterator[list[int] | RowError]:
+    """
+    Lazily read response rows from `stream`. Rows that cannot be parsed are
+    yielded as a `RowError` so that the output stays aligned with the input.
+    """
+    match format:
+        case "jsonl":
+            for line in stream:
+                if line.strip():
+                    try:
+                        yield parse_jsonl_row(line)
+                    except RowError as e:
+                        yield e
+        case "csv":
+            reader = csv.reader(stream)
+            if header:
+                next(reader, None)
+            for row in reader:
+                if row:
+                    try:
+                        yield parse_csv_row(row)
+                    except RowError as e:
+                        yield e
+        case _:
+            raise NotImplementedError("format should be one of", FORMATS)
+
+
+def score_row(
+    survey: pysurvey.Survey, row: list[int] | RowError
+) -> tuple[Any, Optional[str], Optional[str]]:
+    """Score a single row into a `(total, range message, error)` triple."""
+    if isinstance(row, RowError):
+        return None, None, str(row.args[0])
+    try:
+        total = survey.score(row)
+        return total, survey.get_range(total).msg, None
+    except (pysurvey.SurveyError, pysurvey.RangeError, TypeError) as e:
+        return None, None, str(e.args[0]) if e.args else repr(e)
+
+
+def score_chunk(
+    survey: pysurvey.Survey, chunk: Sequence[list[int] | RowError]
+) -> list[tuple[Any, Optional[str], Optional[str]]]:
+    return [score_row(survey=survey, row=row) for row in chunk]
+
+
+def _init_worker(survey: pysurvey.Survey) -> None:
+    global _SURVEY
+    _SURVEY = survey
+
+
+def _score_chunk_worker(
+    chunk: Sequence[list[int] | RowError],
+) -> list[tuple[Any, Optional[str], Optional[str]]]:
+    assert _SURVEY is not None
+    return score_chunk(survey=_SURVEY, chunk=chunk)
+
+
+def chunked(
+    rows: Iterable[list[int] | RowError], size: int
+) -> Iterator[list[list[int] | RowError]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def score_stream(
+    survey: pysurvey.Survey,
+    rows: Iterable[list[int] | RowError],
+    jobs: int = 1,
+    chunk_size: int = 1024,
+) -> Iterator[tuple[Any, Optional[str], Optional[str]]]:
+    """
+    Score `rows` in input order.
+
+    With `jobs > 1`, chunks of `chunk_size` rows are scored in a process pool.
+    At most `2 * jobs` chunks are in flight at any time, so memory use is
+    bounded regardless of the input size.
+    """
+    chunks = chunked(rows=rows, size=chunk_size)
+    if jobs <= 1:
+        for chunk in chunks:
+            yield from score_chunk(survey=survey, chunk=chunk)
+        return
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(survey,)
+    ) as pool:
+        pending: deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_score_chunk_worker, chunk))
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def write_result(
+    result: tuple[Any, Optional[str], Optional[str]],
+    format: str,
+    out: TextIO,
+    writer: Optional[Any] = None,
+) -> None:
+    """Write one result as a `JSONL` object or a CSV row through `writer`."""
+    total, msg, error = result
+    match format:
+        case "jsonl":
+            record = {"total": total, "range": msg}
+            if error is not None:
+                record["error"] = error
+            out.write(json.dumps(record) + "\n")
+        case "csv":
+            row = ["" if total is None else total, msg or ""]
+            if error is not None:
+                row.append(error)
+            writer.writerow(row)
+        case _:
+            raise NotImplementedError("format should be one of", FORMATS)
+
+
+class Progress:
+    """Periodically report the number of processed rows and the throughput."""
+
+    def __init__(self, stream: TextIO, interval: float):
+        self.stream = stream
+        self.interval = interval
+        self.rows = 0
+        self.errors = 0
+        self.start = time.perf_counter()
+        self._last = self.start
+
+    def update(self, error: bool) -> None:
+        self.rows += 1
+        self.errors += error
+        if self.interval > 0:
+            now = time.perf_counter()
+            if now - self._last >= self.interval:
+                self._last = now
+                self.report(now=now)
+
+    def report(self, now: Optional[float] = None, final: bool = False) -> None:
+        elapsed = (now or time.perf_counter()) - self.start
+        rate = self.rows / elapsed if elapsed > 0 else 0.0
+        print(
+            "done" if final else "progress",
+            f"rows={self.rows} errors={self.errors}",
+            f"elapsed={elapsed:.1f}s rows/s={rate:.0f}",
+            file=self.stream,
+        )
+
+
+def positive_int(value: str) -> int:
+    """An `argparse` type for options such as `--jobs` that must be >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected at least 1, got {number}")
+    return number
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "score",
+        help="score response rows against a survey",
+        description=(
+            "Read response rows from files or stdin, score them against a "
+            "survey and stream totals and range labels to stdout."
+        ),
+    )
+    parser.add_argument("survey", help="path to the survey JSON file")
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="files with response rows, stdin if omitted or '-'",
+    )
+    parser.add_argument("--format", choices=FORMATS, default="jsonl")
+    parser.add_argument(
+        "--header",
+        action="store_true",
+        help="skip the first line of CSV inputs and write a CSV header",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="number of worker processes",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=positive_int,
+        default=1024,
+        help="rows per work unit",
+    )
+    parser.add_argument(
+        "--progress",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="report progress to stderr every SECONDS, 0 to only summarize",
+    )
+
+
+def iter_inputs(
+    inputs: Sequence[str], format: str, header: bool, stack: ExitStack
+) -> Iterator[list[int] | RowError]:
+    for path in inputs or ["-"]:
+        if path == "-":
+            stream = sys.stdin
+        else:
+            stream = stack.enter_context(open(path, "r", newline=""))
+        yield from read_rows(stream=stream, format=format, header=header)
+
+
+def main(args: argparse.Namespace) -> int:
+    survey = pysurvey.Survey.read_json(args.survey)
+    progress = Progress(stream=sys.stderr, interval=args.progress)
+    out = sys.stdout
+    writer = csv.writer(out, lineterminator="\n")
+    if args.format == "csv" and args.header:
+        writer.writerow(["total", "range"])
+    try:
+        with ExitStack() as stack:
+            rows = iter_inputs(
+                inputs=args.inputs,
+                format=args.format,
+                header=args.header,
+                stack=stack,
+            )
+            for result in score_stream(
+                survey=survey,
+                rows=rows,
+                jobs=args.jobs,
+                chunk_size=args.chunk_size,
+            ):
+                write_result(
+                    result=result, format=args.format, out=out, writer=writer
+                )
+                progress.update(error=result[2] is not None)
+        out.flush()
+    except BrokenPipeError:
+        # The reader went away, e.g. `| head`. Point stdout at devnull so the
+        # flush at interpreter exit does not raise again, and stop quietly.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, out.fileno())
+        return 1
+    progress.report(final=True)
+    return 1 if progress.errors else 0
@@ -1,6 +1,35 @@
 __all__ = [
+    # .batch
+    "Aggregator",
+    "BatchError",
+    "BatchJob",
+    "ScoreSummary",
+    # .builder
+    "SurveyBuilder",
+    # .columnar
+    "ColumnarArchive",
+    "NpyColumn",
+    "NpyWriter",
+    "export_columns",
+    # .dedup
+    "BloomFilter",
+    "DuplicateFilter",
+    "ScalableBloomFilter",
+    # .item_stats
+    "ItemStatistics",
+    # .journal
+    "Journal",
+    "JournalError",
+    "read_journal",
     # .json_serializable
     "JsonSerializable",
+    # .label_index
+    "IngestResult",
+    "LabelIndex",
+    # .loader
+    "LoadResult",
+    "load_surveys",
+    "survey_fingerprint",
     # .qanda
     "HasMessage",
     "Numeric",
@@ -8,13 +37,49 @@ __all__ = [
     "Response",
     "Question",
     "QuestionError",
+    # .rank
+    "RankIndex",
+    # .reband
+    "Rebander",
+    "reband_columns",
+    "reband_records",
+    "reband_totals",
+    # .sampling
+    "ReservoirSampler",
+    "StratifiedSampler",
+    "by_range",
+    "by_response",
+    # .shared
+    "AggregateSnapshot",
+    "FrozenSurvey",
+    "ShardedAggregator",
+    # .simulation
+    "SimulationReport",
+    "random_survey",
+    "response_stream",
+    "simulate",
     # .survey
     "RangeError",
+    "Subscale",
+    "SubscaleScore",
     "Survey",
     "SurveyError",
+    # .validation
+    "RowIssue",
+    "ValidationIssue",
+    "ValidationResult",
+    "validate_rows",
 ]
 
+from .batch import Aggregator, BatchError, BatchJob, ScoreSummary
+from .builder import SurveyBuilder
+from .columnar import ColumnarArchive, NpyColumn, NpyWriter, export_columns
+from .dedup import BloomFilter, DuplicateFilter, ScalableBloomFilter
+from .item_stats import ItemStatistics
+from .journal import Journal, JournalError, read_journal
 from .json_serializable import JsonSerializable
+from .label_index import IngestResult, LabelIndex
+from .loader import LoadResult, load_surveys, survey_fingerprint
 from .qanda import (
     HasMessage,
     Numeric,
@@ -23,4 +88,25 @@ from .qanda import (
     QuestionError,
     OpenRange,
 )
-from .survey import RangeError, Survey, SurveyError
+from .rank import RankIndex
+from .reband import Rebander, reband_columns, reband_records, reband_totals
+from .sampling import (
+    ReservoirSampler,
+    StratifiedSampler,
+    by_range,
+    by_response,
+)
+from .shared import AggregateSnapshot, FrozenSurvey, ShardedAggregator
+from .simulation import (
+    SimulationReport,
+    random_survey,
+    response_stream,
+    simulate,
+)
+from .survey import RangeError, Subscale, SubscaleScore, Survey, SurveyError
+from .validation import (
+    RowIssue,
+    ValidationIssue,
+    ValidationResult,
+    validate_rows,
+)
@@ -0,0 +1,215 @@
+"""`batch`: checkpointed, resumable batch jobs over `JSONL` archives."""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional, Protocol, Self, Union
+
+from .survey import Survey
+
+
+class BatchError(Exception): ...
+
+
+class Aggregator(Protocol):
+    """The per-record work of a `BatchJob`, with a serializable state."""
+
+    def update(self, record: dict[str, Any]) -> Optional[str]:
+        """Process one record, optionally returning one line of output."""
+        ...
+
+    def to_state(self) -> Any:
+        """Get the partial aggregate as a `JSON` serializable object."""
+        ...
+
+    def load_state(self, state: Any) -> None:
+        """Restore the partial aggregate returned by `to_state`."""
+        ...
+
+
+class ScoreSummary:
+    """
+    Score serialized `RespondeeSurvey` records against `survey`, counting
+    the records per range. With `write_scores=True`, every record also
+    produces an output line with its total and range message.
+    """
+
+    def __init__(self, survey: Survey, write_scores: bool = False):
+        self.survey = survey
+        self.write_scores = write_scores
+        self.count = 0
+        self.total = 0
+        self.range_counts: dict[str, int] = {
+            range_.msg: 0 for range_ in survey.ranges
+        }
+
+    def update(self, record: dict[str, Any]) -> Optional[str]:
+        total = self.survey.score(record["responses"])
+        msg = self.survey.get_range(total).msg
+        self.count += 1
+        self.total += total
+        self.range_counts[msg] += 1
+        if self.write_scores:
+            return json.dumps({"total": total, "range": msg})
+        return None
+
+    def to_state(self) -> Any:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "range_counts": self.range_counts,
+        }
+
+    def load_state(self, state: Any) -> None:
+        self.count = state["count"]
+        self.total = state["total"]
+        self.range_counts = dict(state["range_counts"])
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    """Replace `path` with `data` so that readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class BatchJob:
+    """
+    Feed every `JSON` line of `input_path` to an `Aggregator`, persisting
+    progress to `checkpoint_path` every `checkpoint_every` records or
+    `checkpoint_interval` seconds, whichever comes first.
+
+    A checkpoint holds the input byte offset, the output byte offset and
+    the aggregator state. The output is fsynced before the checkpoint is
+    atomically replaced. On restart, the job seeks to the checkpointed
+    input offset, truncates output written after the checkpoint and restores
+    the aggregator, so no record is counted or written twice.
+
+    With `on_error="raise"` (the default), a line that cannot be parsed or
+    aggregated stops the run. With `on_error="skip"`, such lines are passed
+    over and counted in `errors`, which is checkpointed as well, so a single
+    bad line cannot block every resume.
+    """
+
+    def __init__(
+        self,
+        input_path: Union[Path, str],
+        checkpoint_path: Union[Path, str],
+        aggregator: Aggregator,
+        output_path: Optional[Union[Path, str]] = None,
+        checkpoint_every: int = 10_000,
+        checkpoint_interval: float = 30.0,
+        on_error: str = "raise",
+    ):
+        match on_error:
+            case "raise" | "skip":
+                pass
+            case _:
+                raise NotImplementedError(
+                    "on_error should be 'raise' or 'skip'", on_error
+                )
+        self.input_path = Path(input_path)
+        self.checkpoint_path = Path(checkpoint_path)
+        self.output_path = None if output_path is None else Path(output_path)
+        self.aggregator = aggregator
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self.on_error = on_error
+        self.offset = 0
+        self.output_offset = 0
+        self.records = 0
+        self.errors = 0
+        self.done = False
+
+    def _load_checkpoint(self) -> None:
+        if not self.checkpoint_path.exists():
+            return
+        with open(self.checkpoint_path, "r") as f:
+            checkpoint = json.load(f)
+        if checkpoint["input"] != str(self.input_path):
+            raise BatchError(
+                "checkpoint belongs to another input",
+                checkpoint["input"],
+                str(self.input_path),
+            )
+        self.offset = checkpoint["offset"]
+        self.output_offset = checkpoint["output_offset"]
+        self.records = checkpoint["records"]
+        self.errors = checkpoint.get("errors", 0)
+        self.done = checkpoint["done"]
+        self.aggregator.load_state(checkpoint["state"])
+
+    def _checkpoint(self, output) -> None:
+        if output is not None:
+            output.flush()
+            os.fsync(output.fileno())
+            self.output_offset = output.tell()
+        _write_atomic(
+            self.checkpoint_path,
+            json.dumps(
+                {
+                    "input": str(self.input_path),
+                    "offset": self.offset,
+                    "output_offset": self.output_offset,
+                    "records": self.records,
+                    "errors": self.errors,
+                    "done": self.done,
+                    "state": self.aggregator.to_state(),
+                }
+            ),
+        )
+
+    def run(self, limit: Optional[int] = None) -> Self:
+        """
+        Run or resume the job until the end of the input, or until `limit`
+        more records were processed. Returns the job itself.
+        """
+        self._load_checkpoint()
+        if self.done:
+            return self
+        output = None
+        if self.output_path is not None:
+            mode = "r+b" if self.output_path.exists() else "wb"
+            output = open(self.output_path, mode)
+            output.truncate(self.output_offset)
+            output.seek(self.output_offset)
+        try:
+            with open(self.input_path, "rb") as f:
+                f.seek(self.offset)
+                processed = pending = 0
+                last = time.monotonic()
+                for line in f:
+                    if limit is not None and processed >= limit:
+                        break
+                    if line.strip():
+                        try:
+                            out = self.aggregator.update(json.loads(line))
+                        except Exception:
+                            if self.on_error == "raise":
+                                raise
+                            self.errors += 1
+                        else:
+                            if out is not None and output is not None:
+                                output.write(out.encode("utf-8") + b"\n")
+                            self.records += 1
+                        processed += 1
+                        pending += 1
+                    self.offset += len(line)
+                    if pending >= self.checkpoint_every or (
+                        pending
+                        and time.monotonic() - last >= self.checkpoint_interval
+                    ):
+                        self._checkpoint(output)
+                        pending = 0
+                        last = time.monotonic()
+                else:
+                    self.done = True
+            self._checkpoint(output)
+        finally:
+            if output is not None:
+                output.close()
+        return self
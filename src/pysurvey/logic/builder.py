@@ -0,0 +1,230 @@
+"""`builder`: edit a survey one question, response or range at a time."""
+
+from bisect import bisect_right
+from typing import Optional, Self, Sequence
+
+from .qanda import Numeric, OpenRange, Question, QuestionError, Response
+from .survey import RangeBound, RangeError, Subscale, Survey, SurveyError
+
+
+class SurveyBuilder:
+    """
+    A mutable, incrementally validated `Survey` under construction.
+
+    The builder keeps the minimum and maximum score of every question and the
+    running question span, so an edit only touches the edited question or the
+    neighbours of the edited range. Checking whether the ranges still cover
+    the span and are connected is O(1), and `build` creates the `Survey`
+    without another full validation pass. Subscales are the exception: with
+    subscales, `validate` rechecks all subscores in O(R) for R responses.
+    """
+
+    def __init__(self) -> None:
+        self._questions: list[Question] = []
+        self._bounds: list[tuple[Numeric, Numeric]] = []
+        self._ranges: list[OpenRange] = []
+        self._lowers: list[Numeric] = []
+        # The number of consecutive ranges that do not connect.
+        self._gaps = 0
+        self._span_lower = 0
+        self._span_higher = 0
+        self._subscales: list[Subscale] = []
+        # The number of responses that carry subscores.
+        self._subscored = 0
+
+    @classmethod
+    def from_survey(cls, survey: Survey) -> Self:
+        builder = cls()
+        for question in survey.questions:
+            builder.add_question(question)
+        for range_ in survey.ranges:
+            builder.add_range(range_)
+        builder.set_subscales(survey.subscales)
+        return builder
+
+    # --------------------------------------------------------------------------
+    # Q U E S T I O N S
+    # --------------------------------------------------------------------------
+    @property
+    def questions(self) -> tuple[Question, ...]:
+        return tuple(self._questions)
+
+    @property
+    def span(self) -> OpenRange:
+        """Same as `Survey._calculate_question_span`, but in O(1)."""
+        return OpenRange(
+            msg="", lower=self._span_lower, higher=self._span_higher + 1
+        )
+
+    @staticmethod
+    def _response_bounds(question: Question) -> tuple[Numeric, Numeric]:
+        range_ = question._get_response_range()
+        return range_.lower, range_.higher
+
+    def _set_bounds(self, i: int, bounds: tuple[Numeric, Numeric]) -> None:
+        lower, higher = self._bounds[i]
+        self._span_lower += bounds[0] - lower
+        self._span_higher += bounds[1] - higher
+        self._bounds[i] = bounds
+
+    @staticmethod
+    def _insertion_index(index: Optional[int], length: int) -> int:
+        """Resolve `index` like `list.insert` does, to a non-negative index."""
+        if index is None:
+            return length
+        if index < 0:
+            index += length
+        return min(max(index, 0), length)
+
+    @staticmethod
+    def _existing_index(index: int, length: int) -> int:
+        """Resolve `index` like `list.pop` does, to a non-negative index."""
+        resolved = index + length if index < 0 else index
+        if not 0 <= resolved < length:
+            raise IndexError("index out of range", index, length)
+        return resolved
+
+    def add_question(
+        self, question: Question, index: Optional[int] = None
+    ) -> int:
+        """Insert a copy of `question` at `index` (default: last), returning its index."""
+        question = Question(
+            msg=question.msg, responses=list(question.responses)
+        )
+        index = self._insertion_index(index, len(self._questions))
+        self._questions.insert(index, question)
+        self._bounds.insert(index, (0, 0))
+        self._set_bounds(index, self._response_bounds(question))
+        self._subscored += sum(bool(r.subscores) for r in question.responses)
+        return index
+
+    def remove_question(self, index: int) -> Question:
+        index = self._existing_index(index, len(self._questions))
+        self._set_bounds(index, (0, 0))
+        del self._bounds[index]
+        question = self._questions.pop(index)
+        self._subscored -= sum(bool(r.subscores) for r in question.responses)
+        return question
+
+    def add_response(
+        self, question: int, response: Response, index: Optional[int] = None
+    ) -> None:
+        question = self._existing_index(question, len(self._questions))
+        responses = self._questions[question].responses
+        responses.insert(self._insertion_index(index, len(responses)), response)
+        self._subscored += bool(response.subscores)
+        lower, higher = self._bounds[question]
+        self._set_bounds(
+            question, (min(lower, response.score), max(higher, response.score))
+        )
+
+    def remove_response(self, question: int, index: int) -> Response:
+        """Remove a response, only rescanning `question` if it held a bound."""
+        question = self._existing_index(question, len(self._questions))
+        responses = self._questions[question].responses
+        if len(responses) == 1:
+            raise QuestionError("supply at least 1 response")
+        response = responses.pop(self._existing_index(index, len(responses)))
+        self._subscored -= bool(response.subscores)
+        if response.score in self._bounds[question]:
+            self._set_bounds(
+                question, self._response_bounds(self._questions[question])
+            )
+        return response
+
+    # --------------------------------------------------------------------------
+    # R A N G E S
+    # --------------------------------------------------------------------------
+    @property
+    def ranges(self) -> tuple[OpenRange, ...]:
+        return tuple(self._ranges)
+
+    def _is_gap(self, i: int) -> bool:
+        """Whether the range at `i` does not connect to the one before it."""
+        return 0 < i < len(self._ranges) and (
+            self._ranges[i].lower != self._ranges[i - 1].higher
+        )
+
+    def add_range(self, range_: OpenRange) -> int:
+        """Insert `range_`, keeping the ranges sorted, and return its index."""
+        index = bisect_right(self._lowers, range_.lower)
+        self._gaps -= self._is_gap(index)
+        self._ranges.insert(index, range_)
+        self._lowers.insert(index, range_.lower)
+        self._gaps += self._is_gap(index) + self._is_gap(index + 1)
+        return index
+
+    def remove_range(self, index: int) -> OpenRange:
+        index = self._existing_index(index, len(self._ranges))
+        self._gaps -= self._is_gap(index) + self._is_gap(index + 1)
+        del self._lowers[index]
+        range_ = self._ranges.pop(index)
+        self._gaps += self._is_gap(index)
+        return range_
+
+    # --------------------------------------------------------------------------
+    # S U B S C A L E S
+    # --------------------------------------------------------------------------
+    @property
+    def subscales(self) -> tuple[Subscale, ...]:
+        return tuple(self._subscales)
+
+    def set_subscales(self, subscales: Sequence[Subscale]) -> None:
+        """Replace the subscales, which every response needs a subscore for."""
+        self._subscales = [
+            Subscale(name=subscale.name, ranges=list(subscale.ranges))
+            for subscale in subscales
+        ]
+
+    # --------------------------------------------------------------------------
+    # V A L I D A T I O N
+    # --------------------------------------------------------------------------
+    def validate(self) -> None:
+        """Raise the error that `Survey` would raise for the current state."""
+        if len(self._questions) == 0:
+            raise SurveyError("supply at least 1 question")
+        if len(self._ranges) == 0:
+            raise SurveyError("supply at least 1 range")
+        Survey._check_ranges_helper(
+            range_=self._ranges[0],
+            value=self._span_lower,
+            range_bound=RangeBound.Lower,
+        )
+        Survey._check_ranges_helper(
+            range_=self._ranges[-1],
+            value=self._span_higher,
+            range_bound=RangeBound.Higher,
+        )
+        if self._gaps:
+            i = next(
+                (i for i in range(len(self._ranges)) if self._is_gap(i)), None
+            )
+            if i is not None:
+                raise RangeError(f"Range {i - 1} and {i} are disconnected")
+        # Subscores are not tracked incrementally, but fall back to a full check.
+        if self._subscales or self._subscored:
+            Survey._check_subscales(
+                questions=self._questions, subscales=self._subscales
+            )
+
+    def is_valid(self) -> bool:
+        try:
+            self.validate()
+        except (SurveyError, RangeError):
+            return False
+        return True
+
+    def build(self) -> Survey:
+        """Validate in O(1) and create a `Survey` holding copies of the questions."""
+        self.validate()
+        return Survey._from_validated(
+            questions=[
+                Question(msg=question.msg, responses=list(question.responses))
+                for question in self._questions
+            ],
+            ranges=list(self._ranges),
+            subscales=[
+                Subscale(name=subscale.name, ranges=list(subscale.ranges))
+                for subscale in self._subscales
+            ],
+        )
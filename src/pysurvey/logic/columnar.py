@@ -0,0 +1,294 @@
+"""
+`columnar`: export response archives to one `.npy` file per column.
+
+The `.npy` files are written and memory-mapped with the standard library
+only, so `numpy.load(path, mmap_mode="r")` and this module's loader can both
+read them without parsing any `JSON`.
+"""
+
+import ast
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Self, Sequence, Union
+
+from .respondee import RespondeeSurvey
+from .survey import RangeError, Survey, SurveyError
+
+NPY_MAGIC = b"\x93NUMPY"
+# The header is padded to a fixed size so that the row count, which is only
+# known once all records are written, can be patched in afterwards.
+NPY_HEADER_SIZE = 128
+NPY_DESCR = {"B": "<u1", "H": "<u2", "I": "<u4", "q": "<i8", "d": "<f8"}
+
+TOTAL_COLUMN = "total"
+RANGE_COLUMN = "range"
+
+
+def question_column(i: int) -> str:
+    return f"question_{i}"
+
+
+def index_typecode(n: int) -> str:
+    """Get the smallest unsigned `array` typecode that can index `n` items."""
+    if n <= 1 << 8:
+        return "B"
+    if n <= 1 << 16:
+        return "H"
+    return "I"
+
+
+def _npy_header(typecode: str, length: int) -> bytes:
+    header = (
+        f"{{'descr': '{NPY_DESCR[typecode]}', 'fortran_order': False, "
+        f"'shape': ({length},), }}"
+    ).encode("latin1")
+    # Magic (6 bytes), version (2 bytes), header length (2 bytes).
+    padding = NPY_HEADER_SIZE - 10 - len(header) - 1
+    return (
+        NPY_MAGIC
+        + b"\x01\x00"
+        + (NPY_HEADER_SIZE - 10).to_bytes(2, "little")
+        + header
+        + b" " * padding
+        + b"\n"
+    )
+
+
+class NpyWriter:
+    """
+    Stream values of a single `array` typecode to a one-dimensional `.npy` file.
+
+    Values are buffered in chunks of `buffer_size` items, so memory use does not
+    grow with the number of written values.
+    """
+
+    def __init__(
+        self,
+        path: Union[Path, str],
+        typecode: str,
+        buffer_size: int = 1 << 16,
+    ):
+        if typecode not in NPY_DESCR:
+            raise NotImplementedError(
+                "typecode should be one of", tuple(NPY_DESCR)
+            )
+        self.path = Path(path)
+        self.typecode = typecode
+        self.buffer_size = buffer_size
+        self.length = 0
+        self._buffer = array(typecode)
+        self._file = open(self.path, "wb")
+        self._file.write(_npy_header(typecode=typecode, length=0))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def append(self, value: Union[int, float]) -> None:
+        self._buffer.append(value)
+        if len(self._buffer) >= self.buffer_size:
+            self._flush()
+
+    def extend(self, values: Iterable[Union[int, float]]) -> None:
+        if isinstance(values, array) and values.typecode == self.typecode:
+            # Write whole arrays in one go instead of item by item.
+            self._buffer.extend(values)
+            self._flush()
+            return
+        for value in values:
+            self.append(value)
+
+    def _flush(self) -> None:
+        if sys.byteorder != "little":
+            self._buffer.byteswap()
+        self._file.write(self._buffer.tobytes())
+        self.length += len(self._buffer)
+        self._buffer = array(self.typecode)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._flush()
+        self._file.seek(0)
+        self._file.write(
+            _npy_header(typecode=self.typecode, length=self.length)
+        )
+        self._file.close()
+
+
+def export_columns(
+    directory: Union[Path, str],
+    survey: Survey,
+    records: Iterable[Union[RespondeeSurvey, Sequence[int]]],
+) -> int:
+    """
+    Write `records` to `directory` as one `.npy` file per column.
+
+    A `question_<i>.npy` column holds the chosen response index of question
+    `i`, `total.npy` the total score and `range.npy` the index of the range in
+    `survey.ranges` that the total falls in. Records can be `RespondeeSurvey`
+    instances or bare rows of response indices.
+
+    Returns the number of exported records.
+    """
+    directory = Path(directory)
+    os.makedirs(directory, exist_ok=True)
+    integer_scores = all(
+        isinstance(response.score, int)
+        for question in survey.questions
+        for response in question.responses
+    )
+    lowers = [range_.lower for range_ in survey.ranges]
+    writers = [
+        NpyWriter(
+            path=directory / f"{question_column(i)}.npy",
+            typecode=index_typecode(len(question.responses)),
+        )
+        for i, question in enumerate(survey.questions)
+    ]
+    total_writer = NpyWriter(
+        path=directory / f"{TOTAL_COLUMN}.npy",
+        typecode="q" if integer_scores else "d",
+    )
+    range_writer = NpyWriter(
+        path=directory / f"{RANGE_COLUMN}.npy",
+        typecode=index_typecode(len(survey.ranges)),
+    )
+    try:
+        for record in records:
+            if isinstance(record, RespondeeSurvey):
+                responses, total = record.responses, record.score
+            else:
+                responses, total = record, survey.score(record)
+            # Check before appending, so the columns never differ in length.
+            if len(responses) != len(writers):
+                raise SurveyError(
+                    "expected one response per question",
+                    len(responses),
+                    len(writers),
+                )
+            index = bisect_right(lowers, total) - 1
+            if index < 0 or total not in survey.ranges[index]:
+                raise RangeError("score falls out of question range", total)
+            for writer, response in zip(writers, responses):
+                writer.append(response)
+            total_writer.append(total)
+            range_writer.append(index)
+    finally:
+        for writer in (*writers, total_writer, range_writer):
+            writer.close()
+    return total_writer.length
+
+
+class NpyColumn:
+    """
+    A read-only, memory-mapped one-dimensional `.npy` file.
+
+    `values` is a `memoryview` directly on the mapped file: reading a column
+    only pages in the bytes that are actually accessed. Release any slices
+    taken from `values` before calling `close`.
+    """
+
+    def __init__(self, path: Union[Path, str]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        typecode, length, offset = self._parse_header()
+        self.typecode = typecode
+        self.length = length
+        self._data = memoryview(self._mmap)[offset:]
+        if sys.byteorder == "little":
+            self.values = self._data.cast(typecode)
+        else:
+            # Big-endian hosts cannot view the data in place.
+            values = array(typecode)
+            values.frombytes(self._data)
+            values.byteswap()
+            self.values = memoryview(values)
+        if len(self.values) != length:
+            raise ValueError("truncated .npy file", self.path)
+
+    def _parse_header(self) -> tuple[str, int, int]:
+        if self._mmap[:6] != NPY_MAGIC:
+            raise ValueError("not a .npy file", self.path)
+        major = self._mmap[6]
+        size = 2 if major == 1 else 4
+        header_length = int.from_bytes(self._mmap[8 : 8 + size], "little")
+        offset = 8 + size + header_length
+        header = ast.literal_eval(
+            self._mmap[8 + size : offset].decode("latin1")
+        )
+        typecodes = {descr: typecode for typecode, descr in NPY_DESCR.items()}
+        descr = header["descr"].replace("|", "<")
+        if descr not in typecodes or header["fortran_order"]:
+            raise NotImplementedError("unsupported .npy layout", header)
+        if len(header["shape"]) != 1:
+            raise NotImplementedError("expected a 1D .npy file", header)
+        return typecodes[descr], header["shape"][0], offset
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, i):
+        return self.values[i]
+
+    def __iter__(self) -> Iterator[Union[int, float]]:
+        return iter(self.values)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.values.release()
+        self._data.release()
+        self._mmap.close()
+
+
+class ColumnarArchive:
+    """
+    A directory of `.npy` columns as written by `export_columns`.
+
+    Columns are only mapped when first accessed, so reading a few columns of
+    a wide archive does not touch the others.
+    """
+
+    def __init__(self, directory: Union[Path, str]):
+        self.directory = Path(directory)
+        self._columns: dict[str, NpyColumn] = {}
+
+    @property
+    def columns(self) -> list[str]:
+        return sorted(path.stem for path in self.directory.glob("*.npy"))
+
+    def __getitem__(self, name: str) -> NpyColumn:
+        column = self._columns.get(name)
+        if column is None:
+            path = self.directory / f"{name}.npy"
+            if not path.is_file():
+                raise KeyError(name)
+            column = self._columns[name] = NpyColumn(path)
+        return column
+
+    def question(self, i: int) -> NpyColumn:
+        return self[question_column(i)]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self, names: Optional[Sequence[str]] = None) -> None:
+        for name in list(self._columns) if names is None else names:
+            column = self._columns.pop(name, None)
+            if column is not None:
+                column.close()
@@ -0,0 +1,264 @@
+"""`dedup`: probabilistic detection of duplicate submissions at ingest."""
+
+import hashlib
+import json
+import os
+from math import ceil, log
+from pathlib import Path
+from typing import Any, Optional, Self, Union
+
+from .loader import survey_fingerprint
+from .respondee import Respondee, RespondeeSurvey
+
+
+class BloomFilter:
+    """
+    A fixed-size Bloom filter for up to `capacity` keys at a false-positive
+    rate of about `error_rate`.
+
+    The `k` bit positions of a key are derived from a single `blake2b` digest
+    with double hashing.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError(
+                "expected a positive capacity and 0 < error_rate < 1",
+                capacity,
+                error_rate,
+            )
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.m = ceil(-capacity * log(error_rate) / log(2) ** 2)
+        self.k = max(1, round(self.m / capacity * log(2)))
+        self.count = 0
+        self.bits = bytearray((self.m + 7) // 8)
+
+    def _positions(self, key: bytes) -> list[int]:
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.m for i in range(self.k)]
+
+    def __contains__(self, key: bytes) -> bool:
+        bits = self.bits
+        return all(bits[i >> 3] & (1 << (i & 7)) for i in self._positions(key))
+
+    def add(self, key: bytes) -> bool:
+        """Add `key`, returning whether it was (probably) already present."""
+        present = True
+        bits = self.bits
+        for i in self._positions(key):
+            mask = 1 << (i & 7)
+            if not bits[i >> 3] & mask:
+                present = False
+                bits[i >> 3] |= mask
+        if not present:
+            self.count += 1
+        return present
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class ScalableBloomFilter:
+    """
+    A Bloom filter that grows without exceeding its false-positive rate.
+
+    Once the current filter is full, a new filter is added with `growth`
+    times its capacity and `tightening` times its error rate. The first
+    filter gets `error_rate * (1 - tightening)`, so the rates of all filters
+    add up to at most `error_rate`.
+    """
+
+    MAGIC = b"PYSURVEY-SBF1\n"
+
+    def __init__(
+        self,
+        initial_capacity: int = 100_000,
+        error_rate: float = 1e-6,
+        growth: int = 2,
+        tightening: float = 0.5,
+    ):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.filters = [
+            BloomFilter(
+                capacity=initial_capacity,
+                error_rate=error_rate * (1 - tightening),
+            )
+        ]
+
+    def __contains__(self, key: bytes) -> bool:
+        return any(key in filter_ for filter_ in self.filters)
+
+    def __len__(self) -> int:
+        return sum(filter_.count for filter_ in self.filters)
+
+    def add(self, key: bytes) -> bool:
+        """Add `key`, returning whether it was (probably) already present."""
+        if key in self:
+            return True
+        last = self.filters[-1]
+        if last.is_full:
+            last = BloomFilter(
+                capacity=last.capacity * self.growth,
+                error_rate=last.error_rate * self.tightening,
+            )
+            self.filters.append(last)
+        last.add(key)
+        return False
+
+    def save(self, path: Union[Path, str]) -> None:
+        """Atomically write the filter to `path`."""
+        header = {
+            "initial_capacity": self.initial_capacity,
+            "error_rate": self.error_rate,
+            "growth": self.growth,
+            "tightening": self.tightening,
+            "filters": [
+                {
+                    "capacity": f.capacity,
+                    "error_rate": f.error_rate,
+                    "count": f.count,
+                }
+                for f in self.filters
+            ],
+        }
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as fp:
+            fp.write(self.MAGIC)
+            fp.write(json.dumps(header).encode("utf-8") + b"\n")
+            for filter_ in self.filters:
+                fp.write(filter_.bits)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[Path, str]) -> Self:
+        with open(path, "rb") as fp:
+            if fp.readline() != cls.MAGIC:
+                raise ValueError("not a scalable Bloom filter file", path)
+            header = json.loads(fp.readline())
+            instance = cls(
+                initial_capacity=header["initial_capacity"],
+                error_rate=header["error_rate"],
+                growth=header["growth"],
+                tightening=header["tightening"],
+            )
+            instance.filters = []
+            for spec in header["filters"]:
+                filter_ = BloomFilter(
+                    capacity=spec["capacity"], error_rate=spec["error_rate"]
+                )
+                filter_.count = spec["count"]
+                filter_.bits = bytearray(fp.read(len(filter_.bits)))
+                if len(filter_.bits) != (filter_.m + 7) // 8:
+                    raise ValueError("truncated Bloom filter file", path)
+                instance.filters.append(filter_)
+        return instance
+
+
+def submission_key(
+    record: Union[RespondeeSurvey, dict[str, Any]],
+    fingerprint: Optional[str] = None,
+) -> bytes:
+    """
+    Hash the survey, the respondee identity and the response indices of a
+    record, given as a `RespondeeSurvey` or its `JSON` dict.
+
+    The survey is identified by its `survey_fingerprint`, which is computed
+    from the record unless `fingerprint` is given. Pass it when hashing many
+    records of the same survey.
+    """
+    if isinstance(record, dict):
+        respondee = Respondee.from_json(record["respondee"])
+        responses = record["responses"]
+    else:
+        respondee, responses = record.respondee, record.responses
+    if fingerprint is None:
+        fingerprint = survey_fingerprint(
+            record["survey"] if isinstance(record, dict) else record.survey
+        )
+    identity = (
+        respondee.name,
+        respondee.age,
+        respondee.adress,
+        respondee.email,
+        respondee.telephone,
+    )
+    return hashlib.blake2b(
+        json.dumps([fingerprint, identity, list(responses)]).encode("utf-8"),
+        digest_size=16,
+    ).digest()
+
+
+class DuplicateFilter:
+    """
+    Flag submissions whose respondee and responses were seen before.
+
+    Backed by a `ScalableBloomFilter`: a repeated submission is always
+    flagged, and a new one is wrongly flagged with a probability of at most
+    about `error_rate`. With a `path`, the filter is loaded from it when it
+    exists and written back by `save` and on leaving a `with` block.
+
+    A loaded filter keeps the `initial_capacity` and `error_rate` it was
+    created with; passing different ones raises a `ValueError`. Left out,
+    they default to `100_000` and `1e-6` for a new filter.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[Path, str]] = None,
+        initial_capacity: Optional[int] = None,
+        error_rate: Optional[float] = None,
+    ):
+        self.path = None if path is None else Path(path)
+        if self.path is not None and self.path.exists():
+            self.filter = ScalableBloomFilter.load(self.path)
+            for name, value in (
+                ("initial_capacity", initial_capacity),
+                ("error_rate", error_rate),
+            ):
+                if value is not None and value != getattr(self.filter, name):
+                    raise ValueError(
+                        f"{name} differs from the loaded filter",
+                        value,
+                        getattr(self.filter, name),
+                    )
+        else:
+            self.filter = ScalableBloomFilter(
+                initial_capacity=(
+                    100_000 if initial_capacity is None else initial_capacity
+                ),
+                error_rate=1e-6 if error_rate is None else error_rate,
+            )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.save()
+
+    def __len__(self) -> int:
+        return len(self.filter)
+
+    def is_duplicate(
+        self,
+        record: Union[RespondeeSurvey, dict[str, Any]],
+        fingerprint: Optional[str] = None,
+    ) -> bool:
+        """
+        Record a submission, returning whether it is (probably) a duplicate.
+        See `submission_key` for `fingerprint`.
+        """
+        return self.filter.add(submission_key(record, fingerprint=fingerprint))
+
+    def save(self) -> None:
+        if self.path is not None:
+            self.filter.save(self.path)
@@ -0,0 +1,157 @@
+"""`item_stats`: streaming item statistics of scored responses."""
+
+from math import sqrt
+from operator import mul
+from typing import Iterable, Optional, Self, Sequence
+
+from .shared import FrozenSurvey
+from .survey import Survey, SurveyError
+
+
+class ItemStatistics:
+    """
+    Single-pass means and co-moments of `n_items` item scores.
+
+    Single rows use Welford's update, batches are reduced on their own and
+    merged with Chan et al.'s pairwise formula, which also merges shards.
+    Memory is O(Q²) regardless of the number of rows. From the co-moments
+    follow the inter-item covariance matrix, item-total correlations and
+    Cronbach's alpha.
+    """
+
+    def __init__(self, n_items: int):
+        if n_items < 1:
+            raise SurveyError("supply at least 1 item", n_items)
+        self.n_items = n_items
+        self.n = 0
+        self.mean = [0.0] * n_items
+        # The sums of products of deviations from the mean.
+        self.comoment = [[0.0] * n_items for _ in range(n_items)]
+        self._survey: Optional[FrozenSurvey] = None
+
+    @classmethod
+    def for_survey(cls, survey: Survey) -> Self:
+        """Create statistics whose items are the questions of `survey`."""
+        stats = cls(n_items=len(survey.questions))
+        stats._survey = FrozenSurvey.from_survey(survey)
+        return stats
+
+    # --------------------------------------------------------------------------
+    # U P D A T E S
+    # --------------------------------------------------------------------------
+    def _check(self, row: Sequence[float]) -> None:
+        if len(row) != self.n_items:
+            raise SurveyError(
+                "expected one score per item", len(row), self.n_items
+            )
+
+    def update(self, scores: Sequence[float]) -> None:
+        """Add one row of item scores."""
+        self._check(scores)
+        self.n += 1
+        delta = [x - m for x, m in zip(scores, self.mean)]
+        self.mean = [m + d / self.n for m, d in zip(self.mean, delta)]
+        after = [x - m for x, m in zip(scores, self.mean)]
+        for i, d in enumerate(delta):
+            row = self.comoment[i]
+            for j, a in enumerate(after):
+                row[j] += d * a
+
+    def update_batch(self, rows: Iterable[Sequence[float]]) -> None:
+        """Add a batch of rows of item scores, reducing them column-wise."""
+        rows = list(rows)
+        if not rows:
+            return
+        for row in rows:
+            self._check(row)
+        batch = type(self)(self.n_items)
+        batch.n = len(rows)
+        columns = [list(column) for column in zip(*rows)]
+        batch.mean = [sum(column) / batch.n for column in columns]
+        centered = [
+            [x - m for x in column] for column, m in zip(columns, batch.mean)
+        ]
+        for i in range(self.n_items):
+            for j in range(i, self.n_items):
+                c = sum(map(mul, centered[i], centered[j]))
+                batch.comoment[i][j] = batch.comoment[j][i] = c
+        self.merge(batch)
+
+    def merge(self, other: "ItemStatistics") -> None:
+        """Combine the rows of `other` into these statistics."""
+        if other.n_items != self.n_items:
+            raise SurveyError(
+                "cannot merge statistics of different items",
+                self.n_items,
+                other.n_items,
+            )
+        if other.n == 0:
+            return
+        n = self.n + other.n
+        delta = [b - a for a, b in zip(self.mean, other.mean)]
+        factor = self.n * other.n / n
+        self.mean = [m + d * other.n / n for m, d in zip(self.mean, delta)]
+        for i, d in enumerate(delta):
+            row, other_row = self.comoment[i], other.comoment[i]
+            for j, e in enumerate(delta):
+                row[j] += other_row[j] + d * e * factor
+        self.n = n
+
+    def item_scores(self, responses: Sequence[int]) -> list[float]:
+        """Map response indices to item scores via the survey's responses."""
+        if self._survey is None:
+            raise SurveyError("statistics were not created with for_survey")
+        self._survey.score(responses)
+        return [
+            scores[response]
+            for scores, response in zip(self._survey.scores, responses)
+        ]
+
+    def update_responses(self, responses: Sequence[int]) -> None:
+        self.update(self.item_scores(responses))
+
+    def update_responses_batch(self, rows: Iterable[Sequence[int]]) -> None:
+        self.update_batch(self.item_scores(row) for row in rows)
+
+    # --------------------------------------------------------------------------
+    # S T A T I S T I C S
+    # --------------------------------------------------------------------------
+    def covariance(self, ddof: int = 1) -> list[list[float]]:
+        """The inter-item covariance matrix."""
+        if self.n <= ddof:
+            raise SurveyError("not enough rows for the covariance", self.n)
+        return [[c / (self.n - ddof) for c in row] for row in self.comoment]
+
+    def variances(self, ddof: int = 1) -> list[float]:
+        return [row[i] for i, row in enumerate(self.covariance(ddof=ddof))]
+
+    def item_total_correlations(self, corrected: bool = True) -> list[float]:
+        """
+        The correlation of every item with the total score. By default the
+        total excludes the item itself (the corrected item-total correlation).
+        Items without variance get `nan`.
+        """
+        comoment = self.comoment
+        total = sum(map(sum, comoment))
+        correlations = []
+        for i, row in enumerate(comoment):
+            cov, var_item, var_total = sum(row), row[i], total
+            if corrected:
+                cov -= row[i]
+                var_total -= 2 * sum(row) - row[i]
+            denominator = sqrt(var_item * var_total) if var_item > 0 else 0.0
+            correlations.append(
+                cov / denominator if denominator > 0 else float("nan")
+            )
+        return correlations
+
+    def cronbach_alpha(self) -> float:
+        """Cronbach's alpha, `nan` if the total score has no variance."""
+        if self.n_items < 2:
+            raise SurveyError("alpha needs at least 2 items", self.n_items)
+        total = sum(map(sum, self.comoment))
+        if total <= 0:
+            return float("nan")
+        items = sum(row[i] for i, row in enumerate(self.comoment))
+        k = self.n_items
+        return k / (k - 1) * (1 - items / total)
@@ -0,0 +1,259 @@
+"""
+`journal`: an append-only, segmented log of `RespondeeSurvey` records.
+
+Every record is one line `<crc32 as 8 hex digits> <JSON>\\n`. A crash can
+only tear the last line of the last segment; opening a `Journal` truncates
+that segment back to the end of its last intact record. A corrupt record
+that is followed by intact ones is not a torn write and raises a
+`JournalError` instead.
+"""
+
+import json
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Self, Union
+
+from .json_serializable import JsonSerializable
+from .respondee import RespondeeSurvey
+
+
+class JournalError(Exception): ...
+
+
+SEGMENT_SUFFIX = ".jsonl"
+
+
+def encode_record(payload: bytes) -> bytes:
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+
+def decode_record(line: bytes) -> Optional[bytes]:
+    """Get the payload of a complete record line, or `None` if it is torn."""
+    if len(line) < 10 or line[8:9] != b" " or not line.endswith(b"\n"):
+        return None
+    payload = line[9:-1]
+    try:
+        crc = int(line[:8], 16)
+    except ValueError:
+        return None
+    return payload if zlib.crc32(payload) == crc else None
+
+
+def scan_segment(
+    path: Union[Path, str], offset: int = 0
+) -> Iterator[tuple[int, bytes]]:
+    """
+    Yield `(end offset, payload)` for every intact record in a segment,
+    starting at byte `offset`. Stops at the first torn record.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            payload = decode_record(line)
+            if payload is None:
+                return
+            offset += len(line)
+            yield offset, payload
+
+
+def has_intact_records(path: Union[Path, str], offset: int) -> bool:
+    """Whether any intact record follows byte `offset` in a segment."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return any(decode_record(line) is not None for line in f)
+
+
+def fsync_directory(directory: Union[Path, str]) -> None:
+    """Make the creation of files in `directory` durable, where supported."""
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def list_segments(directory: Union[Path, str], prefix: str) -> list[Path]:
+    return sorted(Path(directory).glob(f"{prefix}-*{SEGMENT_SUFFIX}"))
+
+
+class Journal:
+    """
+    Append records to size-rotated segment files with group commit.
+
+    Records are written through a buffered file. They become durable when
+    the journal commits, i.e. flushes and `fsync`s the segment, which happens
+    every `commit_every` records, every `commit_interval_ms` milliseconds
+    (from a background thread) and on `close`. A `Journal` can be shared by
+    multiple threads.
+
+    Parameters
+    ----------
+    `directory : Union[Path, str]`
+        The directory holding the segments, created if needed.
+    `commit_every : int`, optional
+        Commit after this many appended records. By default `256`.
+    `commit_interval_ms : float`, optional
+        Commit pending records at least this often, `0` to disable. By
+        default `10`.
+    `segment_size : int`, optional
+        Start a new segment once the current one reaches this many bytes.
+        By default 64 MiB.
+    `prefix : str`, optional
+        The file name prefix of the segments. By default `"journal"`.
+    `fsync : bool`, optional
+        Whether (`True`) or not (`False`) to `fsync` on commit. By default
+        `True`.
+    """
+
+    def __init__(
+        self,
+        directory: Union[Path, str],
+        commit_every: int = 256,
+        commit_interval_ms: float = 10,
+        segment_size: int = 64 << 20,
+        prefix: str = "journal",
+        fsync: bool = True,
+    ):
+        self.directory = Path(directory)
+        self.commit_every = commit_every
+        self.commit_interval_ms = commit_interval_ms
+        self.segment_size = segment_size
+        self.prefix = prefix
+        self.fsync = fsync
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._pending = 0
+        segments = list_segments(self.directory, prefix=prefix)
+        if segments:
+            self._segment = int(segments[-1].stem.rsplit("-", 1)[1])
+            self._recover(segments[-1])
+        else:
+            self._segment = 0
+        self._open_segment()
+
+        self._closed = threading.Event()
+        self._committer = None
+        if commit_interval_ms > 0:
+            self._committer = threading.Thread(
+                target=self._commit_periodically, daemon=True
+            )
+            self._committer.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _open_segment(self) -> None:
+        path = self._segment_path(self._segment)
+        created = not path.exists()
+        self._file = open(path, "ab")
+        self._size = self._file.tell()
+        if created and self.fsync:
+            # Without this, a crash can lose the new segment and its records.
+            fsync_directory(self.directory)
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.directory / f"{self.prefix}-{segment:08d}{SEGMENT_SUFFIX}"
+
+    @staticmethod
+    def _recover(path: Path) -> None:
+        """Truncate a torn record at the end of the segment at `path`."""
+        end = 0
+        for end, _ in scan_segment(path):
+            pass
+        if end != os.path.getsize(path):
+            if has_intact_records(path, end):
+                raise JournalError(
+                    "corrupt record in journal segment", path, end
+                )
+            with open(path, "r+b") as f:
+                f.truncate(end)
+                os.fsync(f.fileno())
+
+    def append(self, record: Union[JsonSerializable, str]) -> None:
+        """Append a record, or an already serialized single-line `JSON` string."""
+        payload = record if isinstance(record, str) else record.to_json()
+        if "\n" in payload:
+            raise JournalError("record payload spans multiple lines")
+        line = encode_record(payload.encode("utf-8"))
+        with self._lock:
+            if self._file.closed:
+                raise JournalError("journal is closed", self.directory)
+            if self._size and self._size + len(line) > self.segment_size:
+                self._rotate()
+            self._file.write(line)
+            self._size += len(line)
+            self._pending += 1
+            if self._pending >= self.commit_every:
+                self._commit()
+
+    def commit(self) -> None:
+        """Make all appended records durable."""
+        with self._lock:
+            if not self._file.closed:
+                self._commit()
+
+    def _commit(self) -> None:
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def _rotate(self) -> None:
+        self._commit()
+        self._file.close()
+        self._segment += 1
+        self._open_segment()
+
+    def _commit_periodically(self) -> None:
+        interval = self.commit_interval_ms / 1000
+        while not self._closed.wait(interval):
+            with self._lock:
+                if self._pending and not self._file.closed:
+                    self._commit()
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._committer is not None:
+            self._committer.join()
+        with self._lock:
+            if not self._file.closed:
+                self._commit()
+                self._file.close()
+
+
+def iter_journal(
+    directory: Union[Path, str], prefix: str = "journal"
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield the `JSON` payload of every intact record in the journal.
+
+    Only the last segment may end in a torn record, which is skipped;
+    corruption anywhere else raises a `JournalError`.
+    """
+    segments = list_segments(directory, prefix=prefix)
+    for i, path in enumerate(segments):
+        end = 0
+        for end, payload in scan_segment(path):
+            yield json.loads(payload)
+        if end != os.path.getsize(path) and (
+            i < len(segments) - 1 or has_intact_records(path, end)
+        ):
+            raise JournalError("corrupt record in journal segment", path, end)
+
+
+def read_journal(
+    directory: Union[Path, str],
+    prefix: str = "journal",
+    parse: Callable[[dict[str, Any]], Any] = RespondeeSurvey.from_json,
+) -> Iterator[Any]:
+    """Yield every record in the journal, parsed as a `RespondeeSurvey` by default."""
+    for payload in iter_journal(directory, prefix=prefix):
+        yield parse(payload)
@@ -1,16 +1,250 @@
 # Standard library.
 from pathlib import Path
-from typing import Any, Self, Union
+from typing import Any, Optional, Self, Union
 import os
 
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import asdict, fields, is_dataclass
 from abc import abstractmethod
 
 # import msgspec
 
+# Replaced on every mutation of an object that a cache depends on. A cache
+# that was validated under the current token is fresh without walking it.
+_epoch = object()
+
+# The caches of the objects that opted in with `enable_json_cache`, by `id`.
+# Every cache holds its object, so that no other object can take its `id`.
+_caches: dict[int, "_JsonCache"] = {}
+
+# The subclasses that report field assignments, by original class.
+_tracked_classes: dict[type, type] = {}
+
+# Values that `json` encodes by itself, so lists of them are encoded at once.
+_LEAF_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _touch() -> None:
+    """Mark all caches for revalidation."""
+    global _epoch
+    _epoch = object()
+
+
+class _TrackedList(list):
+    """A `list` that marks all caches for revalidation when it is mutated."""
+
+    __slots__ = ()
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        # Copies and pickles are plain lists, which no cache depends on.
+        return list, (list(self),)
+
+
+def _tracked_mutator(name: str):
+    mutate = getattr(list, name)
+
+    def tracked(self, *args, **kwargs):
+        _touch()
+        return mutate(self, *args, **kwargs)
+
+    tracked.__name__ = name
+    return tracked
+
+
+for _name in (
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "__setitem__",
+    "append",
+    "clear",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(_TrackedList, _name, _tracked_mutator(_name))
+
+
+def _tracked_class(cls: type) -> type:
+    """
+    Get a subclass of the mutable dataclass `cls` with the same layout, whose
+    field assignments mark all caches for revalidation. Instances compare
+    equal to, and pickle as, instances of `cls`.
+    """
+    tracked = _tracked_classes.get(cls)
+    if tracked is not None:
+        return tracked
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        _touch()
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        return _untracked, (
+            cls,
+            {f.name: getattr(self, f.name) for f in fields(cls)},
+        )
+
+    namespace = {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__setattr__": __setattr__,
+        "__reduce_ex__": __reduce_ex__,
+        "_json_tracked": True,
+    }
+    if cls.__dataclass_params__.eq:
+
+        def __eq__(self, other: Any) -> bool:
+            if type(other) not in (cls, tracked):
+                return NotImplemented
+            return all(
+                getattr(self, f.name) == getattr(other, f.name)
+                for f in fields(cls)
+                if f.compare
+            )
+
+        namespace["__eq__"] = __eq__
+        namespace["__hash__"] = cls.__hash__
+    tracked = type(cls.__name__, (cls,), namespace)
+    _tracked_classes[cls] = tracked
+    return tracked
+
+
+def _untracked(cls: type, state: dict[str, Any]) -> Any:
+    """Recreate an instance of `cls` from its fields, without `__init__`."""
+    value = cls.__new__(cls)
+    for name, field_value in state.items():
+        object.__setattr__(value, name, field_value)
+    return value
+
+
+def _track(value: Any) -> None:
+    """
+    Report the field assignments of the mutable dataclass `value`, and the
+    in-place mutations of the lists it holds, to the caches.
+    """
+    if not getattr(type(value), "_json_tracked", False):
+        object.__setattr__(value, "__class__", _tracked_class(type(value)))
+    for f in fields(value):
+        field_value = getattr(value, f.name)
+        if type(field_value) is list:
+            object.__setattr__(value, f.name, _TrackedList(field_value))
+
+
+class _JsonCache:
+    """
+    The cached text of an object and what it was built from: `nodes` holds
+    every mutable dataclass and container that was walked with a snapshot of
+    what it held, `children` every spliced cache with its text. `untracked`
+    is set if a node does not report its mutations, which means the cache
+    has to be revalidated on every use.
+    """
+
+    __slots__ = ("value", "text", "nodes", "children", "untracked", "epoch")
+
+    def __init__(self, value: Any):
+        self.value = value
+        self.text: Optional[str] = None
+        self.nodes: list[tuple[Any, tuple]] = []
+        self.children: list[tuple["_JsonCache", str]] = []
+        self.untracked = False
+        self.epoch: Optional[object] = None
+
+    def get(self) -> str:
+        if self.text is not None:
+            if self.epoch is _epoch and not self.untracked:
+                return self.text
+            if self.is_fresh():
+                self.epoch = _epoch
+                return self.text
+        self.epoch = _epoch
+        self.nodes, self.children, self.untracked = [], [], False
+        self.text = _dataclass_fragment(self.value, self)
+        return self.text
+
+    def is_fresh(self) -> bool:
+        # A child whose cache was disabled may be stale.
+        return all(
+            _unchanged(value, snapshot) for value, snapshot in self.nodes
+        ) and all(
+            _caches.get(id(child.value)) is child and child.get() is text
+            for child, text in self.children
+        )
+
+
+def _snapshot(value: Any) -> tuple:
+    """The objects directly held by a dataclass or container."""
+    if isinstance(value, dict):
+        return (*value.keys(), *value.values())
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return tuple(getattr(value, f.name) for f in fields(value))
+
+
+def _unchanged(value: Any, snapshot: tuple) -> bool:
+    current = _snapshot(value)
+    return len(current) == len(snapshot) and all(
+        a is b for a, b in zip(current, snapshot)
+    )
+
+
+def _dataclass_fragment(value: Any, cache: Optional[_JsonCache]) -> str:
+    if cache is not None and not value.__dataclass_params__.frozen:
+        if isinstance(value, JsonSerializable):
+            _track(value)
+        else:
+            cache.untracked = True
+        cache.nodes.append((value, _snapshot(value)))
+    items = ", ".join(
+        f"{json.dumps(f.name)}: {_fragment(getattr(value, f.name), cache)}"
+        for f in fields(value)
+    )
+    return "{" + items + "}"
+
+
+def _fragment(value: Any, cache: Optional[_JsonCache]) -> str:
+    """
+    Serialize `value` exactly like `json.dumps(asdict(...))` would, splicing
+    in the text of the objects that have caching enabled.
+
+    While building `cache`, everything that is walked is recorded in it and
+    mutable `JsonSerializable` objects start reporting their mutations.
+    """
+    if isinstance(value, JsonSerializable):
+        child = _caches.get(id(value))
+        if child is not None:
+            text = child.get()
+            if cache is not None:
+                cache.children.append((child, text))
+                cache.untracked |= child.untracked
+            return text
+    if is_dataclass(value) and not isinstance(value, type):
+        return _dataclass_fragment(value, cache)
+    if isinstance(value, (list, tuple)):
+        if cache is not None and isinstance(value, list):
+            cache.untracked |= type(value) is not _TrackedList
+            cache.nodes.append((value, _snapshot(value)))
+        if all(type(v) in _LEAF_TYPES for v in value):
+            return json.dumps(value)
+        items = ", ".join(_fragment(v, cache) for v in value)
+        return "[" + items + "]"
+    if isinstance(value, dict):
+        if cache is not None:
+            cache.untracked = True
+            cache.nodes.append((value, _snapshot(value)))
+        # Let `json` convert the keys, e.g. `1` to `"1"` and `None` to `"null"`.
+        items = ", ".join(
+            f"{json.dumps({k: 0})[1:-4]}: {_fragment(v, cache)}"
+            for k, v in value.items()
+        )
+        return "{" + items + "}"
+    return json.dumps(value)
+
 
-@dataclass
 class JsonSerializable:
     """
     A base class for a `JSON` (de)serializable object.
@@ -60,8 +294,18 @@ class JsonSerializable:
     new_instance_from_dict = MyDataClass.from_json(json_dict)
     new_instance_from_file = MyDataClass.read_json(p)
     ```
+
+    The base class itself holds no state and defines empty `__slots__`, so that
+    subclasses can be declared with `@dataclass(slots=True)` and, when they are
+    immutable, `frozen=True`.
+
+    Objects that are serialized repeatedly, like a `Survey` shared by many
+    `RespondeeSurvey` records, can opt in to caching their `JSON` text with
+    `enable_json_cache`. Objects without a cache pay nothing for this.
     """
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         """Get a `str` representation."""
         return self.to_json()
@@ -93,9 +337,47 @@ class JsonSerializable:
         Write the instance to a `dict` in `JSON` format.
         Non-initialized fields are ignored, as these cannot be deserialized.
         """
+        if _caches:
+            cache = _caches.get(id(self))
+            if cache is not None:
+                return cache.get()
+            # Splice in the text of any nested object with caching enabled.
+            return _fragment(self, None)
         return json.dumps(asdict(self))
         # return msgspec.json.format(buf=msgspec.json.encode(self), indent=indent)
 
+    def enable_json_cache(self) -> Self:
+        """
+        Cache the serialized form of this instance, which is then reused by
+        `to_json`, `write_json` and the serialization of any parent object,
+        cached or not. Records that share a cached `Survey` then only
+        serialize their own fields.
+
+        The cache stays valid until a field of the instance or of an object
+        nested in it is assigned, or a `list` field of one is mutated in
+        place. To notice this, the nested mutable objects are switched to a
+        subclass that reports assignments, and their `list` fields are
+        replaced by a `list` subclass that reports mutations. Keep using the
+        fields, not the lists that were passed in: mutating those no longer
+        affects the instance. Mutations of other nested containers, like
+        `dict`s, are found by comparing every nested object on every use.
+
+        The instance is kept alive until `disable_json_cache` is called.
+        """
+        if id(self) not in _caches:
+            _caches[id(self)] = _JsonCache(self)
+        return self
+
+    def disable_json_cache(self) -> None:
+        _caches.pop(id(self), None)
+
+    def invalidate_json(self) -> None:
+        """Force the cache to be rebuilt, and all others to be revalidated."""
+        _touch()
+        cache = _caches.get(id(self))
+        if cache is not None:
+            cache.text = None
+
     def write_json(
         self,
         path: Union[Path, str],
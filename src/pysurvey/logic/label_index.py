@@ -0,0 +1,99 @@
+"""`label_index`: map response labels back to response indices."""
+
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Sequence
+
+from .qanda import QuestionError
+from .survey import Survey
+
+
+def normalize_label(label: str) -> str:
+    """Casefold `label` and collapse all runs of whitespace to single spaces."""
+    return " ".join(label.split()).casefold()
+
+
+@dataclass
+class IngestResult:
+    """
+    The outcome of `LabelIndex.ingest`.
+
+    `rows` holds the index rows of all fully resolved input rows, `rejected`
+    the input row numbers that contained at least one unknown label, and
+    `unknown` maps each question (column) index to the unknown labels and
+    how often they were encountered.
+    """
+
+    rows: list[list[int]] = field(default_factory=list)
+    rejected: list[int] = field(default_factory=list)
+    unknown: dict[int, dict[str, int]] = field(default_factory=dict)
+
+
+class LabelIndex:
+    """
+    A per-question `label -> response index` hash index of a `Survey`.
+
+    Build it once per survey and reuse it for every row, turning each lookup
+    into a single `dict` access instead of a scan over `Question.responses`.
+    With `normalize=True`, labels are matched case- and whitespace-insensitive.
+    """
+
+    def __init__(self, survey: Survey, normalize: bool = False):
+        self.normalize = normalize
+        self._tables: list[dict[str, int]] = []
+        for i, question in enumerate(survey.questions):
+            table: dict[str, int] = {}
+            for j, response in enumerate(question.responses):
+                key = self._key(response.msg)
+                if key in table:
+                    raise QuestionError(
+                        f"question {i} has duplicate response label", key
+                    )
+                table[key] = j
+            self._tables.append(table)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def _key(self, label: str) -> str:
+        return normalize_label(label) if self.normalize else label
+
+    def get(self, question: int, label: str) -> Optional[int]:
+        """Get the response index of `label`, or `None` if it is unknown."""
+        return self._tables[question].get(self._key(label))
+
+    def lookup(self, question: int, label: str) -> int:
+        """Get the response index of `label`, raising a `QuestionError` if unknown."""
+        index = self.get(question=question, label=label)
+        if index is None:
+            raise QuestionError(
+                f"unknown response label for question {question}", label
+            )
+        return index
+
+    def ingest(self, rows: Iterable[Sequence[str]]) -> IngestResult:
+        """
+        Convert rows of response labels into rows of response indices.
+
+        Rows with the wrong number of columns are rejected without
+        being recorded as unknown labels.
+        """
+        result = IngestResult()
+        tables = self._tables
+        n_questions = len(tables)
+        key = normalize_label if self.normalize else None
+        for i, row in enumerate(rows):
+            if len(row) != n_questions:
+                result.rejected.append(i)
+                continue
+            if key is not None:
+                row = [key(label) for label in row]
+            indices = [table.get(label) for table, label in zip(tables, row)]
+            if None not in indices:
+                result.rows.append(indices)
+                continue
+            result.rejected.append(i)
+            for column, (index, label) in enumerate(zip(indices, row)):
+                if index is None:
+                    counts = result.unknown.setdefault(column, {})
+                    counts[label] = counts.get(label, 0) + 1
+        return result
@@ -0,0 +1,107 @@
+"""`loader`: load many survey definitions concurrently."""
+
+import hashlib
+import json
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from .survey import Survey
+
+
+def survey_fingerprint(survey: Union[Survey, dict[str, Any]]) -> str:
+    """
+    Get a `sha256` hex digest of the canonical `JSON` form of `survey`, given
+    as a `Survey` or its `JSON` dict.
+    """
+    data = survey if isinstance(survey, dict) else asdict(survey)
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def parse_survey(data: bytes) -> tuple[str, Survey]:
+    """Parse and validate a survey file's content, returning its fingerprint."""
+    survey = Survey.from_json(json.loads(data))
+    return survey_fingerprint(survey), survey
+
+
+def _read(path: Path) -> Union[bytes, OSError]:
+    try:
+        return path.read_bytes()
+    except OSError as e:
+        return e
+
+
+@dataclass
+class LoadResult:
+    """
+    The outcome of `load_surveys`.
+
+    `surveys` maps fingerprints to surveys, so identical definitions are
+    only kept once; `paths` lists the files of every fingerprint. `errors`
+    maps every file that could not be loaded to its exception, such as a
+    `SurveyError`, `RangeError`, `json.JSONDecodeError` or `OSError`.
+    """
+
+    surveys: dict[str, Survey] = field(default_factory=dict)
+    paths: dict[str, list[Path]] = field(default_factory=dict)
+    errors: dict[Path, Exception] = field(default_factory=dict)
+
+    def add(self, path: Path, fingerprint: str, survey: Survey) -> None:
+        self.surveys.setdefault(fingerprint, survey)
+        self.paths.setdefault(fingerprint, []).append(path)
+
+
+def load_surveys(
+    paths: Union[Path, str, Iterable[Union[Path, str]]],
+    pattern: str = "*.json",
+    io_workers: int = 16,
+    parse_workers: Optional[int] = None,
+) -> LoadResult:
+    """
+    Load survey `JSON` files without failing fast.
+
+    Files are read by a pool of `io_workers` threads and parsed and validated
+    by a pool of `parse_workers` processes (by default one per CPU, `0` to
+    parse in the calling process). `paths` is either a directory, whose files
+    matching `pattern` are loaded, or an iterable of files.
+    """
+    if isinstance(paths, (str, Path)):
+        paths = sorted(Path(paths).glob(pattern))
+    else:
+        paths = [Path(path) for path in paths]
+
+    result = LoadResult()
+    with ThreadPoolExecutor(max_workers=io_workers) as io_pool:
+        contents = io_pool.map(_read, paths)
+        if parse_workers == 0:
+            for path, data in zip(paths, contents):
+                if isinstance(data, OSError):
+                    result.errors[path] = data
+                    continue
+                try:
+                    result.add(path, *parse_survey(data))
+                except Exception as e:
+                    result.errors[path] = e
+            return result
+
+        with ProcessPoolExecutor(max_workers=parse_workers) as parse_pool:
+            futures: list[tuple[Path, Future]] = []
+            for path, data in zip(paths, contents):
+                if isinstance(data, OSError):
+                    result.errors[path] = data
+                else:
+                    futures.append(
+                        (path, parse_pool.submit(parse_survey, data))
+                    )
+            for path, future in futures:
+                try:
+                    result.add(path, *future.result())
+                except Exception as e:
+                    result.errors[path] = e
+    return result
@@ -17,7 +17,7 @@ class HasMessage(Protocol):
     msg: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OpenRange(JsonSerializable, Generic[Numeric]):
     """
     Behaves like a `range`: inclusive at lower end, exclusive at higher end.
@@ -49,10 +49,12 @@ class OpenRange(JsonSerializable, Generic[Numeric]):
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Response(JsonSerializable, Generic[Numeric]):
     msg: str
     score: Numeric
+    # One score per subscale of the survey, in the order of its `subscales`.
+    subscores: tuple[Numeric, ...] = ()
 
     # def __init__(self, msg: str, score: Numeric):
     #     self.msg = msg
@@ -67,6 +69,10 @@ class Response(JsonSerializable, Generic[Numeric]):
     def __eq__(self, other: Self) -> bool:
         return self.score == other.score
 
+    def __hash__(self) -> int:
+        # Consistent with `__eq__`, which only compares scores.
+        return hash(self.score)
+
     @classmethod
     def from_json(cls, json: dict[str, Any]) -> Self:
         """
@@ -75,10 +81,11 @@ class Response(JsonSerializable, Generic[Numeric]):
         return Response(
             msg=json["msg"],
             score=json["score"],
+            subscores=tuple(json.get("subscores", ())),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Question(JsonSerializable):
     msg: str
     responses: Sequence[Response]
@@ -98,6 +105,10 @@ class Question(JsonSerializable):
             higher = max(response.score, higher)
         return OpenRange(msg="", lower=lower, higher=higher)
 
+    def _get_subscore_range(self, dimension: int) -> OpenRange:
+        scores = [response.subscores[dimension] for response in self.responses]
+        return OpenRange(msg="", lower=min(scores), higher=max(scores))
+
     @classmethod
     def from_json(cls, json: dict[str, Any]) -> Self:
         """
@@ -0,0 +1,124 @@
+"""`rank`: live percentile ranks of scores within the population."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Self, Union
+
+from .survey import RangeError, Survey
+
+
+class RankIndex:
+    """
+    Counts of integer scores in `[lower, higher)`, kept in a Fenwick tree.
+
+    Both recording a score and querying how many recorded scores fall below
+    a score take O(log S), with S the width of the span. Trees over the same
+    span merge by element-wise addition, so workers can build their own
+    index and combine them afterwards.
+    """
+
+    def __init__(self, lower: int, higher: int):
+        if not (isinstance(lower, int) and isinstance(higher, int)):
+            raise RangeError(
+                "a rank index needs an integer span", lower, higher
+            )
+        if higher <= lower:
+            raise RangeError(
+                "a rank index needs a non-empty span", lower, higher
+            )
+        self.lower = lower
+        self.higher = higher
+        self.total = 0
+        # 1-based: `_tree[i]` holds the counts of the `i & -i` scores up to i.
+        self._tree = [0] * (higher - lower + 1)
+
+    @classmethod
+    def from_survey(cls, survey: Survey) -> Self:
+        """Create an empty index over the question span of `survey`."""
+        span = Survey._calculate_question_span(survey.questions)
+        return cls(lower=span.lower, higher=span.higher)
+
+    def __len__(self) -> int:
+        return self.total
+
+    def add(self, score: int, count: int = 1) -> None:
+        if not self.lower <= score < self.higher:
+            raise RangeError("score falls out of question range", score)
+        tree = self._tree
+        i = score - self.lower + 1
+        while i < len(tree):
+            tree[i] += count
+            i += i & -i
+        self.total += count
+
+    def count_below(self, score: int) -> int:
+        """Get the number of recorded scores strictly below `score`."""
+        i = min(max(score - self.lower, 0), self.higher - self.lower)
+        tree = self._tree
+        count = 0
+        while i > 0:
+            count += tree[i]
+            i -= i & -i
+        return count
+
+    def count_at(self, score: int) -> int:
+        if not self.lower <= score < self.higher:
+            return 0
+        return self.count_below(score + 1) - self.count_below(score)
+
+    def percentile_rank(self, score: int) -> float:
+        """
+        Get the fraction of recorded scores strictly below `score`, e.g.
+        `0.72` for "you scored higher than 72% of respondents".
+        """
+        return self.count_below(score) / self.total if self.total else 0.0
+
+    def merge(self, other: "RankIndex") -> None:
+        """Add the counts of `other`, which must cover the same span."""
+        if (self.lower, self.higher) != (other.lower, other.higher):
+            raise RangeError(
+                "cannot merge rank indices over different spans",
+                (self.lower, self.higher),
+                (other.lower, other.higher),
+            )
+        self._tree = [a + b for a, b in zip(self._tree, other._tree)]
+        self.total += other.total
+
+    # --------------------------------------------------------------------------
+    # P E R S I S T E N C E
+    # --------------------------------------------------------------------------
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "lower": self.lower,
+                "higher": self.higher,
+                "total": self.total,
+                "tree": self._tree,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, json: dict[str, Any]) -> Self:
+        """Parse a `dict` in `JSON` format, as written by `to_json`."""
+        index = cls(lower=json["lower"], higher=json["higher"])
+        if len(json["tree"]) != len(index._tree):
+            raise RangeError("rank index tree does not match its span")
+        index._tree = list(json["tree"])
+        index.total = json["total"]
+        return index
+
+    def save(self, path: Union[Path, str]) -> None:
+        """Atomically write the index to `path` in `JSON` format."""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w") as f:
+            f.write(self.to_json())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[Path, str]) -> Self:
+        with open(path, "r") as f:
+            return cls.from_json(json.load(f))
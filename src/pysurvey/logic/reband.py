@@ -0,0 +1,113 @@
+"""`reband`: reassign stored totals to revised ranges without rescoring."""
+
+import json
+import os
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence, Union
+
+from .columnar import (
+    RANGE_COLUMN,
+    TOTAL_COLUMN,
+    NpyColumn,
+    NpyWriter,
+    index_typecode,
+)
+from .qanda import Numeric, OpenRange
+from .survey import RangeError, Survey
+
+# Integer spans up to this size are rebanded through a precomputed table.
+MAX_TABLE_SPAN = 1 << 20
+
+
+class Rebander:
+    """
+    Map totals to the index of their range in `survey.ranges`.
+
+    Integer question spans get a `total -> range index` table built once
+    from the sorted range boundaries, so every total costs one `dict` lookup
+    in a C-level `map`. Other spans fall back to a binary search of the
+    sorted lower bounds.
+    """
+
+    def __init__(self, survey: Survey):
+        self.ranges = list(survey.ranges)
+        self.lowers = [range_.lower for range_ in self.ranges]
+        span = Survey._calculate_question_span(survey.questions)
+        self.table = None
+        if (
+            isinstance(span.lower, int)
+            and isinstance(span.higher, int)
+            and span.higher - span.lower <= MAX_TABLE_SPAN
+        ):
+            self.table = {
+                total: bisect_right(self.lowers, total) - 1
+                for total in range(span.lower, span.higher)
+            }
+
+    def index(self, total: Numeric) -> int:
+        i = bisect_right(self.lowers, total) - 1
+        if i < 0 or total not in self.ranges[i]:
+            raise RangeError("score falls out of question range", total)
+        return i
+
+    def reband(self, totals: Iterable[Numeric]) -> array:
+        """Get the range index of every total, as a compact unsigned `array`."""
+        typecode = index_typecode(len(self.ranges))
+        if self.table is None:
+            return array(typecode, map(self.index, totals))
+        try:
+            return array(typecode, map(self.table.__getitem__, totals))
+        except KeyError as e:
+            raise RangeError("score falls out of question range", e.args[0])
+
+
+def reband_totals(
+    survey: Survey, ranges: Sequence[OpenRange], totals: Iterable[Numeric]
+) -> array:
+    """
+    Validate `ranges` against the question span of `survey` and get the
+    index into the sorted `ranges` of every total.
+    """
+    return Rebander(survey.with_ranges(ranges)).reband(totals)
+
+
+def reband_records(
+    survey: Survey,
+    ranges: Sequence[OpenRange],
+    records: Iterable[Union[str, bytes, dict[str, Any]]],
+) -> Iterator[tuple[Numeric, OpenRange]]:
+    """
+    Yield the stored total and its new range for every serialized
+    `RespondeeSurvey`, without rebuilding or rescoring the records.
+    """
+    rebander = Rebander(survey.with_ranges(ranges))
+    for record in records:
+        if not isinstance(record, dict):
+            record = json.loads(record)
+        total = record["score"]
+        yield total, rebander.ranges[rebander.index(total)]
+
+
+def reband_columns(
+    directory: Union[Path, str], survey: Survey, ranges: Sequence[OpenRange]
+) -> Survey:
+    """
+    Rewrite the range column of a columnar export (see `export_columns`)
+    for new `ranges`, reading only the total column.
+
+    The new column replaces the old one atomically. Returns the survey with
+    the new ranges, whose `ranges` the new indices refer to.
+    """
+    rebanded = survey.with_ranges(ranges)
+    rebander = Rebander(rebanded)
+    directory = Path(directory)
+    path = directory / f"{RANGE_COLUMN}.npy"
+    tmp = directory / f"{RANGE_COLUMN}.npy.tmp"
+    with NpyColumn(directory / f"{TOTAL_COLUMN}.npy") as totals:
+        indices = rebander.reband(totals.values)
+    with NpyWriter(path=tmp, typecode=indices.typecode) as writer:
+        writer.extend(indices)
+    os.replace(tmp, path)
+    return rebanded
@@ -4,7 +4,7 @@ from .survey import Survey
 from .json_serializable import JsonSerializable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Respondee(JsonSerializable):
     name: Optional[str] = None
     age: Optional[int] = None
@@ -20,13 +20,14 @@ class Respondee(JsonSerializable):
         return Respondee(
             name=json["name"],
             age=json["age"],
-            adress=json["address"],
+            # Serialized records use the field name, older files "address".
+            adress=json.get("adress", json.get("address")),
             email=json["email"],
             telephone=json["telephone"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RespondeeSurvey(JsonSerializable):
     respondee: Respondee
     survey: Survey
@@ -34,13 +35,8 @@ class RespondeeSurvey(JsonSerializable):
     score: int = field(init=False)
 
     def __post_init__(self):
-        score = 0
-        for response, question in zip(
-            self.responses, self.survey.questions, strict=True
-        ):
-            assert 0 <= response < len(question.responses)
-            score += question.responses[response].score
-        self.score = score
+        # Raises a `SurveyError` for invalid responses, also under `python -O`.
+        self.score = self.survey.score(self.responses)
 
     @classmethod
     def from_json(cls, json: dict[str, Any]) -> Self:
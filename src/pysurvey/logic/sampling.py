@@ -0,0 +1,131 @@
+"""`sampling`: one-pass, bounded-memory samples of response streams."""
+
+from math import exp, floor, log
+from random import Random
+from typing import Any, Callable, Generic, Hashable, Iterable, TypeVar
+
+from .shared import FrozenSurvey
+from .survey import Survey
+
+T = TypeVar("T")
+
+
+class ReservoirSampler(Generic[T]):
+    """
+    A uniform random sample of at most `k` items from a stream of unknown
+    length.
+
+    Uses Li's "Algorithm L", which draws how many items to skip instead of a
+    random number per item, so sampling a long stream is dominated by
+    iterating it. The sample is reproducible from `seed`.
+    """
+
+    def __init__(self, k: int, seed: Any = None):
+        if k < 1:
+            raise ValueError("sample size should be at least 1", k)
+        self.k = k
+        self.seen = 0
+        self._rng = Random(seed)
+        self._reservoir: list[T] = []
+        self._w = 1.0
+        self._next = 0
+
+    def _uniform(self) -> float:
+        """Draw from the open interval (0, 1)."""
+        while (u := self._rng.random()) == 0.0:
+            pass
+        return u
+
+    def _skip(self) -> None:
+        self._w *= exp(log(self._uniform()) / self.k)
+        self._next += floor(log(self._uniform()) / log(1 - self._w)) + 1
+
+    def add(self, item: T) -> None:
+        i = self.seen
+        self.seen += 1
+        if i < self.k:
+            self._reservoir.append(item)
+            if i == self.k - 1:
+                self._next = i
+                self._skip()
+        elif i == self._next:
+            self._reservoir[self._rng.randrange(self.k)] = item
+            self._skip()
+
+    def extend(self, items: Iterable[T]) -> None:
+        for item in items:
+            self.add(item)
+
+    @property
+    def sample(self) -> list[T]:
+        return list(self._reservoir)
+
+
+class StratifiedSampler(Generic[T]):
+    """
+    A `ReservoirSampler` of at most `k` items per stratum, where `key` maps
+    every item to its stratum.
+
+    Each stratum draws from a generator derived from `seed` and the stratum
+    itself, so samples do not depend on the order in which strata first
+    appear. Memory is bounded by `k` times the number of strata.
+    """
+
+    def __init__(self, k: int, key: Callable[[T], Hashable], seed: Any = None):
+        self.k = k
+        self.key = key
+        self.seed = seed
+        self._samplers: dict[Hashable, ReservoirSampler[T]] = {}
+
+    def add(self, item: T) -> None:
+        stratum = self.key(item)
+        sampler = self._samplers.get(stratum)
+        if sampler is None:
+            sampler = self._samplers[stratum] = ReservoirSampler(
+                k=self.k,
+                seed=None if self.seed is None else f"{self.seed}-{stratum!r}",
+            )
+        sampler.add(item)
+
+    def extend(self, items: Iterable[T]) -> None:
+        for item in items:
+            self.add(item)
+
+    @property
+    def seen(self) -> dict[Hashable, int]:
+        return {
+            stratum: sampler.seen for stratum, sampler in self._samplers.items()
+        }
+
+    @property
+    def samples(self) -> dict[Hashable, list[T]]:
+        return {
+            stratum: sampler.sample
+            for stratum, sampler in self._samplers.items()
+        }
+
+
+def _responses(record: Any) -> list[int]:
+    """The responses of a `RespondeeSurvey`, its `JSON` dict, or a bare row."""
+    if isinstance(record, dict):
+        return record["responses"]
+    return getattr(record, "responses", record)
+
+
+def by_range(survey: Survey) -> Callable[[Any], int]:
+    """Stratify records by the index of the range their total falls in."""
+    frozen = FrozenSurvey.from_survey(survey)
+
+    def key(record: Any) -> int:
+        return frozen.range_index(frozen.score(_responses(record)))
+
+    return key
+
+
+def by_response(question: int) -> Callable[[Any], int]:
+    """Stratify records by the response index chosen for `question`."""
+
+    def key(record: Any) -> int:
+        return _responses(record)[question]
+
+    return key
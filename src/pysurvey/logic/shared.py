@@ -0,0 +1,156 @@
+"""`shared`: immutable surveys and contention-free aggregation for threads."""
+
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Generic, Optional, Self, Sequence
+
+from .qanda import Numeric
+from .survey import RangeError, Survey, SurveyError
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSurvey(Generic[Numeric]):
+    """
+    An immutable scoring view of a `Survey`.
+
+    All state is held in tuples, so a single instance can be shared by any
+    number of threads without locking, also on free-threaded builds. Later
+    changes to the source `Survey` are not reflected.
+    """
+
+    scores: tuple[tuple[Numeric, ...], ...]
+    lowers: tuple[Numeric, ...]
+    highers: tuple[Numeric, ...]
+    labels: tuple[str, ...]
+
+    @classmethod
+    def from_survey(cls, survey: Survey) -> Self:
+        return cls(
+            scores=tuple(
+                tuple(response.score for response in question.responses)
+                for question in survey.questions
+            ),
+            lowers=tuple(range_.lower for range_ in survey.ranges),
+            highers=tuple(range_.higher for range_ in survey.ranges),
+            labels=tuple(range_.msg for range_ in survey.ranges),
+        )
+
+    def score(self, responses: Sequence[int]) -> Numeric:
+        """Like `Survey.score`, but lock-free on the immutable score table."""
+        if len(responses) != len(self.scores):
+            raise SurveyError(
+                "expected one response per question",
+                len(responses),
+                len(self.scores),
+            )
+        score = 0
+        for i, (response, scores) in enumerate(zip(responses, self.scores)):
+            if type(response) is not int:
+                raise SurveyError(
+                    f"response {response!r} for question {i} is not an index",
+                    response,
+                )
+            if not 0 <= response < len(scores):
+                raise SurveyError(
+                    f"response {response} out of bounds for question {i}",
+                    response,
+                    len(scores),
+                )
+            score += scores[response]
+        return score
+
+    def range_index(self, score: Numeric) -> int:
+        """Get the index of the range that `score` falls in."""
+        i = bisect_right(self.lowers, score) - 1
+        if i < 0 or not score < self.highers[i]:
+            raise RangeError("score falls out of question range", score)
+        return i
+
+    def get_range(self, score: Numeric) -> str:
+        """Get the message of the range that `score` falls in."""
+        return self.labels[self.range_index(score)]
+
+
+@dataclass(frozen=True)
+class AggregateSnapshot(Generic[Numeric]):
+    """Merged totals of a `ShardedAggregator`."""
+
+    count: int
+    total: Numeric
+    range_counts: tuple[int, ...]
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+class _Shard:
+    # `(count, total, range_counts)`, replaced as a whole on every record so
+    # readers never see part of one.
+    __slots__ = ("state",)
+
+    def __init__(self, n_ranges: int):
+        self.state: tuple[int, Numeric, tuple[int, ...]] = (
+            0,
+            0,
+            (0,) * n_ranges,
+        )
+
+
+class ShardedAggregator:
+    """
+    Aggregate scores from many threads without a shared lock.
+
+    Every thread writes to its own shard, which is only registered (under a
+    lock) on the first call from that thread. A shard publishes each record
+    by swapping in a new immutable state tuple, so `snapshot` only ever sees
+    whole records. While writers are active a snapshot may miss in-flight
+    records, but once they are done it is exact.
+    """
+
+    def __init__(self, survey: FrozenSurvey):
+        self.survey = survey
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[_Shard] = []
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard(len(self.survey.labels))
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def record(self, score: Numeric) -> int:
+        """Record an already computed score, returning its range index."""
+        i = self.survey.range_index(score)
+        shard = self._shard()
+        count, total, range_counts = shard.state
+        shard.state = (
+            count + 1,
+            total + score,
+            range_counts[:i] + (range_counts[i] + 1,) + range_counts[i + 1 :],
+        )
+        return i
+
+    def add(self, responses: Sequence[int]) -> tuple[Numeric, int]:
+        """Score `responses`, record the result and return the score and range index."""
+        score = self.survey.score(responses)
+        return score, self.record(score)
+
+    def snapshot(self) -> AggregateSnapshot:
+        with self._lock:
+            shards = list(self._shards)
+        range_counts = [0] * len(self.survey.labels)
+        count = total = 0
+        for shard in shards:
+            shard_count, shard_total, shard_range_counts = shard.state
+            count += shard_count
+            total += shard_total
+            for i, n in enumerate(shard_range_counts):
+                range_counts[i] += n
+        return AggregateSnapshot(
+            count=count, total=total, range_counts=tuple(range_counts)
+        )
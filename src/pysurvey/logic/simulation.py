@@ -0,0 +1,212 @@
+"""`simulation`: seeded synthetic surveys, response streams and load tests."""
+
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from math import ceil
+from random import Random
+from typing import Iterator, Optional, Sequence
+
+from .qanda import OpenRange, Question, Response
+from .respondee import Respondee, RespondeeSurvey
+from .survey import Survey
+
+
+def random_survey(
+    seed: int,
+    n_questions: int = 10,
+    n_responses: tuple[int, int] = (2, 5),
+    scores: tuple[int, int] = (0, 5),
+    n_ranges: int = 3,
+) -> Survey:
+    """
+    Create a random `Survey` whose ranges exactly cover its question span.
+
+    Every question gets between `n_responses[0]` and `n_responses[1]`
+    responses scoring between `scores[0]` and `scores[1]` (inclusive). The
+    span is cut into at most `n_ranges` connected ranges at random points.
+    """
+    rng = Random(seed)
+    questions = [
+        Question(
+            msg=f"question{i}",
+            responses=[
+                Response(msg=f"response{j}", score=rng.randint(*scores))
+                for j in range(rng.randint(*n_responses))
+            ],
+        )
+        for i in range(n_questions)
+    ]
+    span = Survey._calculate_question_span(questions)
+    inner = range(span.lower + 1, span.higher)
+    cuts = sorted(rng.sample(inner, k=min(n_ranges - 1, len(inner))))
+    bounds = [span.lower, *cuts, span.higher]
+    return Survey(
+        questions=questions,
+        ranges=[
+            OpenRange(msg=f"range{i}", lower=lower, higher=higher)
+            for i, (lower, higher) in enumerate(zip(bounds, bounds[1:]))
+        ],
+    )
+
+
+def random_responses(
+    survey: Survey,
+    rng: Random,
+    weights: Optional[Sequence[Optional[Sequence[float]]]] = None,
+) -> list[int]:
+    """
+    Pick one response index per question, uniformly or, if given, with the
+    relative `weights[i]` of the responses of question `i`.
+    """
+    return [
+        rng.choices(
+            range(len(question.responses)),
+            weights=None if weights is None else weights[i],
+        )[0]
+        for i, question in enumerate(survey.questions)
+    ]
+
+
+def response_stream(
+    survey: Survey,
+    seed: int,
+    n: Optional[int] = None,
+    weights: Optional[Sequence[Optional[Sequence[float]]]] = None,
+) -> Iterator[list[int]]:
+    """Yield `n` (default: endless) random response rows, reproducible from `seed`."""
+    rng = Random(seed)
+    i = 0
+    while n is None or i < n:
+        yield random_responses(survey=survey, rng=rng, weights=weights)
+        i += 1
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile `q` (0-100) of sorted `values`."""
+    if not values:
+        return float("nan")
+    return values[max(0, ceil(q / 100 * len(values)) - 1)]
+
+
+@dataclass
+class SimulationReport:
+    """
+    The outcome of `simulate`.
+
+    Latencies are in seconds. `memory_per_session` is the peak traced memory
+    divided by the number of concurrent sessions, in bytes, and is `None`
+    when memory tracing was disabled.
+    """
+
+    sessions: int
+    concurrency: int
+    elapsed: float
+    latencies: list[float] = field(repr=False)
+    range_counts: Counter
+    memory_per_session: Optional[float] = None
+
+    @property
+    def throughput(self) -> float:
+        """Completed sessions per second."""
+        return self.sessions / self.elapsed if self.elapsed > 0 else 0.0
+
+    def latency_percentiles(
+        self, qs: Sequence[float] = (50, 90, 99)
+    ) -> dict[float, float]:
+        ordered = sorted(self.latencies)
+        return {q: percentile(ordered, q) for q in qs}
+
+
+def simulate_session(
+    survey: Survey,
+    seed: int,
+    session: int,
+    think_time: float = 0.0,
+    weights: Optional[Sequence[Optional[Sequence[float]]]] = None,
+) -> tuple[str, float]:
+    """
+    Walk one simulated respondent through `survey`, question by question.
+
+    Returns the message of the resulting range and the session latency.
+    """
+    start = time.perf_counter()
+    rng = Random(f"{seed}-{session}")
+    responses = []
+    for i, question in enumerate(survey.questions):
+        if think_time > 0:
+            time.sleep(rng.expovariate(1 / think_time))
+        responses.append(
+            rng.choices(
+                range(len(question.responses)),
+                weights=None if weights is None else weights[i],
+            )[0]
+        )
+    result = RespondeeSurvey(
+        respondee=Respondee(name=f"respondee{session}"),
+        survey=survey,
+        responses=responses,
+    )
+    msg = survey.get_range(result.score).msg
+    return msg, time.perf_counter() - start
+
+
+def simulate(
+    survey: Survey,
+    sessions: int,
+    concurrency: int = 8,
+    seed: int = 0,
+    think_time: float = 0.0,
+    weights: Optional[Sequence[Optional[Sequence[float]]]] = None,
+    trace_memory: bool = False,
+) -> SimulationReport:
+    """
+    Drive `sessions` simulated respondents through `survey` with
+    `concurrency` threads.
+
+    Every session draws from its own generator derived from `seed`, so the
+    chosen responses and `range_counts` are reproducible regardless of
+    thread scheduling. `think_time` is the mean pause before each answer,
+    in seconds.
+    """
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if trace_memory:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(
+                pool.map(
+                    lambda session: simulate_session(
+                        survey=survey,
+                        seed=seed,
+                        session=session,
+                        think_time=think_time,
+                        weights=weights,
+                    ),
+                    range(sessions),
+                )
+            )
+        elapsed = time.perf_counter() - start
+        memory_per_session = None
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            memory_per_session = (peak - baseline) / max(
+                1, min(concurrency, sessions)
+            )
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return SimulationReport(
+        sessions=sessions,
+        concurrency=concurrency,
+        elapsed=elapsed,
+        latencies=[latency for _, latency in results],
+        range_counts=Counter(msg for msg, _ in results),
+        memory_per_session=memory_per_session,
+    )
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Generic, Self, Sequence
 from .qanda import Numeric, Question, OpenRange, Response
@@ -17,10 +17,50 @@ class RangeError(Exception): ...
 class SurveyError(Exception): ...
 
 
+@dataclass(slots=True)
+class Subscale(JsonSerializable):
+    """
+    A named dimension of a survey, scored from the `subscores` of the chosen
+    responses and banded into its own `ranges`.
+    """
+
+    name: str
+    ranges: Sequence[OpenRange]
+
+    def __post_init__(self) -> None:
+        if len(self.ranges) == 0:
+            raise SurveyError("supply at least 1 range", self.name)
+        self.ranges = sorted(self.ranges, key=lambda range_: range_.lower)
+
+    def get_range(self, score: Numeric) -> OpenRange:
+        for range_ in self.ranges:
+            if score in range_:
+                return range_
+        raise RangeError("score falls out of subscale range", self.name, score)
+
+    @classmethod
+    def from_json(cls, json: dict[str, Any]) -> Self:
+        """
+        Parse a `dict` in `JSON` format to a class instance.
+        """
+        return Subscale(
+            name=json["name"],
+            ranges=[OpenRange.from_json(range_) for range_ in json["ranges"]],
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SubscaleScore(Generic[Numeric]):
+    name: str
+    score: Numeric
+    range_: OpenRange
+
+
 @dataclass
 class Survey(JsonSerializable, Generic[Numeric]):
     questions: Sequence[Question]
     ranges: Sequence[OpenRange]
+    subscales: Sequence[Subscale] = field(default_factory=list)
 
     def __post_init__(self) -> None:
         if len(self.questions) == 0:
@@ -29,6 +69,103 @@ class Survey(JsonSerializable, Generic[Numeric]):
             raise SurveyError("supply at least 1 range")
         self.ranges = sorted(self.ranges, key=lambda range_: range_.lower)
         self._check_ranges()
+        self._check_subscales(
+            questions=self.questions, subscales=self.subscales
+        )
+
+    @classmethod
+    def _from_validated(
+        cls,
+        questions: Sequence[Question],
+        ranges: Sequence[OpenRange],
+        subscales: Sequence[Subscale] = (),
+    ) -> Self:
+        """
+        Create a `Survey` without running `__post_init__`.
+
+        Only use this when `ranges` are already sorted and known to pass
+        `_check_ranges`, e.g. from a `SurveyBuilder`.
+        """
+        survey = cls.__new__(cls)
+        survey.questions = questions
+        survey.ranges = ranges
+        survey.subscales = list(subscales)
+        return survey
+
+    def score(self, responses: Sequence[int]) -> Numeric:
+        """
+        Sum the scores of the chosen response indices, one per question.
+
+        Raises a `SurveyError` if the number of responses does not match the
+        number of questions, or if an index is not an `int` (booleans are
+        rejected too) or is out of bounds for its question.
+        """
+        if len(responses) != len(self.questions):
+            raise SurveyError(
+                "expected one response per question",
+                len(responses),
+                len(self.questions),
+            )
+        score = 0
+        for i, (response, question) in enumerate(
+            zip(responses, self.questions)
+        ):
+            if type(response) is not int:
+                raise SurveyError(
+                    f"response {response!r} for question {i} is not an index",
+                    response,
+                )
+            if not 0 <= response < len(question.responses):
+                raise SurveyError(
+                    f"response {response} out of bounds for question {i}",
+                    response,
+                    len(question.responses),
+                )
+            score += question.responses[response].score
+        return score
+
+    def score_subscales(self, responses: Sequence[int]) -> list[SubscaleScore]:
+        """
+        Sum the subscores of the chosen response indices for every subscale
+        in a single pass over the responses, and get the range of each total.
+
+        Raises a `SurveyError` for invalid responses, like `score`.
+        """
+        if len(responses) != len(self.questions):
+            raise SurveyError(
+                "expected one response per question",
+                len(responses),
+                len(self.questions),
+            )
+        totals = [0] * len(self.subscales)
+        for i, (response, question) in enumerate(
+            zip(responses, self.questions)
+        ):
+            if type(response) is not int:
+                raise SurveyError(
+                    f"response {response!r} for question {i} is not an index",
+                    response,
+                )
+            if not 0 <= response < len(question.responses):
+                raise SurveyError(
+                    f"response {response} out of bounds for question {i}",
+                    response,
+                    len(question.responses),
+                )
+            totals = [
+                total + subscore
+                for total, subscore in zip(
+                    totals, question.responses[response].subscores
+                )
+            ]
+        return [
+            SubscaleScore(
+                name=subscale.name,
+                score=total,
+                range_=subscale.get_range(total),
+            )
+            for subscale, total in zip(self.subscales, totals)
+        ]
 
     def get_range(self, score: int) -> OpenRange:
         for range_ in self.ranges:
@@ -39,34 +176,83 @@ class Survey(JsonSerializable, Generic[Numeric]):
             score,
         )
 
+    def with_ranges(self, ranges: Sequence[OpenRange]) -> Self:
+        """
+        Get a survey with the same questions but other `ranges`, which are
+        validated against the question span like in `__init__`.
+        """
+        return type(self)(
+            questions=self.questions, ranges=ranges, subscales=self.subscales
+        )
+
     def _check_ranges(self) -> bool:
+        """
+        Check the ranges against the span of the question scores, see
+        `_check_ranges_cover`.
+        """
+        return self._check_ranges_cover(
+            ranges=self.ranges,
+            span=self._calculate_question_span(questions=self.questions),
+        )
+
+    @classmethod
+    def _check_subscales(
+        cls, questions: Sequence[Question], subscales: Sequence[Subscale]
+    ) -> bool:
+        """
+        Check that every response has one subscore per subscale and that the
+        ranges of every subscale cover the span of its subscores.
+        """
+        for question in questions:
+            for response in question.responses:
+                if len(response.subscores) != len(subscales):
+                    raise SurveyError(
+                        "expected one subscore per subscale",
+                        response.msg,
+                        len(response.subscores),
+                        len(subscales),
+                    )
+        for dimension, subscale in enumerate(subscales):
+            try:
+                cls._check_ranges_cover(
+                    ranges=subscale.ranges,
+                    span=cls._calculate_subscale_span(
+                        questions=questions, dimension=dimension
+                    ),
+                )
+            except RangeError as e:
+                raise RangeError(f"subscale {subscale.name}", *e.args)
+        return True
+
+    @classmethod
+    def _check_ranges_cover(
+        cls, ranges: Sequence[OpenRange], span: OpenRange
+    ) -> bool:
         """
         Assumes that the ranges are sorted increasingly.
 
         Check that:
-        1. the ranges cover the entire spectrum of the answers.
+        1. the ranges cover the entire `span` of the answers.
         2. the ranges are non-overlapping.
         """
-        question_range = self._calculate_question_span(questions=self.questions)
-
         # First range should map to the lowest answers ...
-        self._check_ranges_helper(
-            range_=self.ranges[0],
-            value=question_range.lower,
+        cls._check_ranges_helper(
+            range_=ranges[0],
+            value=span.lower,
             range_bound=RangeBound.Lower,
         )
         # ... and the last range should map to the highest.
         # An OpenRange is exclusive at the higher end, making the higher bound
         # 1 larger than the actual largest value in the questions.
-        self._check_ranges_helper(
-            range_=self.ranges[-1],
-            value=question_range.higher - 1,
+        cls._check_ranges_helper(
+            range_=ranges[-1],
+            value=span.higher - 1,
             range_bound=RangeBound.Higher,
         )
         # For exactly 1 range no comparisons are needed (or possible, indexing wise).
-        if len(self.ranges) > 1:
-            previous = self.ranges[0]
-            for i, range_ in enumerate(self.ranges[1:]):
+        if len(ranges) > 1:
+            previous = ranges[0]
+            for i, range_ in enumerate(ranges[1:]):
                 # TODO: should use one-based indexes?
                 if range_.lower != previous.higher:
                     raise RangeError(f"Range {i} and {i + 1} are disconnected")
@@ -106,6 +292,17 @@ class Survey(JsonSerializable, Generic[Numeric]):
             higher += range_.higher
         return OpenRange(msg="", lower=lower, higher=higher)
 
+    @classmethod
+    def _calculate_subscale_span(
+        cls, questions: Sequence[Question], dimension: int
+    ) -> OpenRange:
+        lower, higher = 0, 1
+        for question in questions:
+            range_ = question._get_subscore_range(dimension)
+            lower += range_.lower
+            higher += range_.higher
+        return OpenRange(msg="", lower=lower, higher=higher)
+
     @classmethod
     def from_json(cls, json: dict[str, Any]) -> Self:
         """
@@ -116,6 +313,10 @@ class Survey(JsonSerializable, Generic[Numeric]):
                 Question.from_json(question) for question in json["questions"]
             ],
             ranges=[OpenRange.from_json(range_) for range_ in json["ranges"]],
+            subscales=[
+                Subscale.from_json(subscale)
+                for subscale in json.get("subscales", [])
+            ],
         )
 
 
@@ -0,0 +1,137 @@
+"""`validation`: check many response rows against a survey at once."""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Iterator, Optional, Sequence
+
+from .survey import Survey
+
+
+class ValidationIssue(Enum):
+    Length = "length"
+    Type = "type"
+    Bounds = "bounds"
+
+
+@dataclass(frozen=True, slots=True)
+class RowIssue:
+    """Why `row` is invalid; `column` is `None` for whole-row issues."""
+
+    row: int
+    column: Optional[int]
+    issue: ValidationIssue
+
+
+@dataclass
+class ValidationResult:
+    """
+    The outcome of `validate_rows`.
+
+    `mask[i]` is `1` if row `i` is valid and `0` otherwise. `errors` holds the
+    issues of the invalid rows, at most `max_errors` of them if that was set.
+    """
+
+    mask: bytearray
+    errors: list[RowIssue] = field(default_factory=list)
+
+    @property
+    def n_valid(self) -> int:
+        return self.mask.count(1)
+
+    def valid_indices(self) -> list[int]:
+        return [i for i, ok in enumerate(self.mask) if ok]
+
+    def select(self, rows: Sequence[Any]) -> Iterator[Any]:
+        """Yield only the valid rows of `rows`."""
+        for ok, row in zip(self.mask, rows, strict=True):
+            if ok:
+                yield row
+
+
+def response_counts(survey: Survey) -> list[int]:
+    return [len(question.responses) for question in survey.questions]
+
+
+def validate_rows(
+    survey: Survey, rows: Sequence[Any], max_errors: Optional[int] = None
+) -> ValidationResult:
+    """
+    Check an N×Q matrix of response indices against `survey`.
+
+    Every row must hold one `int` per question that is a valid index into
+    that question's responses. Unlike `RespondeeSurvey`, invalid rows do not
+    raise: they are flagged in the returned mask and listed as `RowIssue`s,
+    so that the valid rows can still be scored.
+
+    `rows` can be a sequence of sequences or a two-dimensional integer
+    array such as a `numpy.ndarray`, which is checked with array-wide
+    comparisons instead of a Python loop.
+    """
+    counts = response_counts(survey)
+    if getattr(rows, "ndim", None) == 2:
+        return _validate_array(counts, rows, max_errors)
+
+    n_questions = len(counts)
+    mask = bytearray(len(rows))
+    errors: list[RowIssue] = []
+    for i, row in enumerate(rows):
+        # Fast path for the common case of a valid row.
+        if (
+            isinstance(row, (list, tuple))
+            and len(row) == n_questions
+            and all(type(r) is int and 0 <= r < n for r, n in zip(row, counts))
+        ):
+            mask[i] = 1
+            continue
+        if max_errors is not None and len(errors) >= max_errors:
+            continue
+        errors.extend(_row_issues(i, row, counts))
+    if max_errors is not None:
+        del errors[max_errors:]
+    return ValidationResult(mask=mask, errors=errors)
+
+
+def _row_issues(i: int, row: Any, counts: Sequence[int]) -> list[RowIssue]:
+    if not isinstance(row, (list, tuple)) or len(row) != len(counts):
+        return [RowIssue(row=i, column=None, issue=ValidationIssue.Length)]
+    issues = []
+    for j, (r, n) in enumerate(zip(row, counts)):
+        if type(r) is not int:
+            issues.append(RowIssue(row=i, column=j, issue=ValidationIssue.Type))
+        elif not 0 <= r < n:
+            issues.append(
+                RowIssue(row=i, column=j, issue=ValidationIssue.Bounds)
+            )
+    return issues
+
+
+def _validate_array(
+    counts: Sequence[int], rows: Any, max_errors: Optional[int]
+) -> ValidationResult:
+    n_rows, n_columns = rows.shape
+    if n_columns != len(counts) or rows.dtype.kind not in "iu":
+        issue = (
+            ValidationIssue.Length
+            if n_columns != len(counts)
+            else ValidationIssue.Type
+        )
+        n_errors = n_rows if max_errors is None else min(n_rows, max_errors)
+        return ValidationResult(
+            mask=bytearray(n_rows),
+            errors=[
+                RowIssue(row=i, column=None, issue=issue)
+                for i in range(n_errors)
+            ],
+        )
+    ok = (rows >= 0) & (rows < counts)
+    mask = bytearray(ok.all(axis=1).tobytes())
+    bad_rows, bad_columns = (~ok).nonzero()
+    if max_errors is not None:
+        bad_rows, bad_columns = bad_rows[:max_errors], bad_columns[:max_errors]
+    return ValidationResult(
+        mask=mask,
+        errors=[
+            RowIssue(row=int(i), column=int(j), issue=ValidationIssue.Bounds)
+            for i, j in zip(bad_rows.tolist(), bad_columns.tolist())
+        ],
+    )
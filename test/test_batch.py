@@ -0,0 +1,169 @@
+import os
+import shutil
+import unittest
+
+from pysurvey import BatchError, BatchJob, ScoreSummary, SurveyError
+from pysurvey.logic.respondee import Respondee, RespondeeSurvey
+from pysurvey.logic.survey import make_dummy_survey
+
+
+class CrashingSummary(ScoreSummary):
+    """Raises once after `crash_after` records, like a pre-empted worker."""
+
+    def __init__(self, *args, crash_after: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.crash_after = crash_after
+
+    def update(self, record):
+        if self.crash_after == 0:
+            self.crash_after = -1
+            raise KeyboardInterrupt
+        self.crash_after -= 1
+        return super().update(record)
+
+
+class TestBatchJob(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.survey = make_dummy_survey()
+        cls.rows = [[i % 2, (i // 2) % 2, (i // 4) % 2] for i in range(8)] * 5
+
+    def setUp(self) -> None:
+        self.path = os.path.splitext(__file__)[0] + "_batch"
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.makedirs(self.path)
+        self.input = os.path.join(self.path, "archive.jsonl")
+        self.checkpoint = os.path.join(self.path, "checkpoint.json")
+        self.output = os.path.join(self.path, "scores.jsonl")
+        with open(self.input, "w") as f:
+            for i, row in enumerate(self.rows):
+                record = RespondeeSurvey(
+                    respondee=Respondee(name=f"respondee{i}"),
+                    survey=self.survey,
+                    responses=row,
+                )
+                f.write(record.to_json() + "\n")
+                if i == 10:
+                    f.write("\n")
+
+    def _expected(self) -> ScoreSummary:
+        job = BatchJob(
+            input_path=self.input,
+            checkpoint_path=os.path.join(self.path, "expected.json"),
+            aggregator=ScoreSummary(self.survey, write_scores=True),
+            output_path=os.path.join(self.path, "expected.jsonl"),
+        )
+        return job.run()
+
+    def test_run(self):
+        job = self._expected()
+        self.assertTrue(job.done)
+        self.assertEqual(len(self.rows), job.aggregator.count)
+        self.assertEqual(
+            sum(self.survey.score(row) for row in self.rows),
+            job.aggregator.total,
+        )
+
+    def test_resume_after_crash(self):
+        job = BatchJob(
+            input_path=self.input,
+            checkpoint_path=self.checkpoint,
+            aggregator=CrashingSummary(
+                self.survey, write_scores=True, crash_after=17
+            ),
+            output_path=self.output,
+            checkpoint_every=5,
+        )
+        self.assertRaises(KeyboardInterrupt, job.run)
+        resumed = BatchJob(
+            input_path=self.input,
+            checkpoint_path=self.checkpoint,
+            aggregator=ScoreSummary(self.survey, write_scores=True),
+            output_path=self.output,
+            checkpoint_every=5,
+        ).run()
+        expected = self._expected()
+        self.assertEqual(
+            expected.aggregator.to_state(), resumed.aggregator.to_state()
+        )
+        with open(self.output) as f, open(expected.output_path) as g:
+            self.assertEqual(g.read(), f.read())
+
+    def test_resume_with_limit(self):
+        job = BatchJob(
+            input_path=self.input,
+            checkpoint_path=self.checkpoint,
+            aggregator=ScoreSummary(self.survey),
+        )
+        job.run(limit=7)
+        self.assertFalse(job.done)
+        resumed = BatchJob(
+            input_path=self.input,
+            checkpoint_path=self.checkpoint,
+            aggregator=ScoreSummary(self.survey),
+        ).run()
+        self.assertTrue(resumed.done)
+        self.assertEqual(len(self.rows), resumed.aggregator.count)
+
+    def test_skip_bad_lines(self):
+        with open(self.input, "a") as f:
+            f.write('{"responses": [1, 1, 7]}\n')
+            f.write("not json\n")
+        with open(self.input, "r") as f:
+            lines = f.readlines()
+        with open(self.input, "w") as f:
+            f.writelines(lines[-2:] + lines[:-2])
+        job = BatchJob(
+            input_path=self.input,
+            checkpoint_path=self.checkpoint,
+            aggregator=ScoreSummary(self.survey),
+            checkpoint_every=1,
+        )
+        self.assertRaises(SurveyError, job.run)
+        self.assertEqual(0, job.offset)
+        job = BatchJob(
+            input_path=self.input,
+            checkpoint_path=self.checkpoint,
+            aggregator=ScoreSummary(self.survey),
+            checkpoint_every=1,
+            on_error="skip",
+        )
+        job.run(limit=3)
+        self.assertEqual(2, job.errors)
+        resumed = BatchJob(
+            input_path=self.input,
+            checkpoint_path=self.checkpoint,
+            aggregator=ScoreSummary(self.survey),
+            on_error="skip",
+        ).run()
+        self.assertTrue(resumed.done)
+        self.assertEqual(2, resumed.errors)
+        self.assertEqual(len(self.rows), resumed.aggregator.count)
+        self.assertRaises(
+            NotImplementedError,
+            BatchJob,
+            self.input,
+            self.checkpoint,
+            ScoreSummary(self.survey),
+            on_error="ignore",
+        )
+
+    def test_checkpoint_of_other_input(self):
+        BatchJob(
+            input_path=self.input,
+            checkpoint_path=self.checkpoint,
+            aggregator=ScoreSummary(self.survey),
+        ).run(limit=1)
+        job = BatchJob(
+            input_path=self.output,
+            checkpoint_path=self.checkpoint,
+            aggregator=ScoreSummary(self.survey),
+        )
+        self.assertRaises(BatchError, job.run)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+
+from pysurvey import (
+    OpenRange,
+    Question,
+    QuestionError,
+    RangeError,
+    Response,
+    Survey,
+    SurveyBuilder,
+    SurveyError,
+)
+from pysurvey.logic.survey import make_dummy_survey
+
+
+class TestSurveyBuilder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.survey = make_dummy_survey()
+        self.builder = SurveyBuilder.from_survey(self.survey)
+
+    def test_build_equals_survey(self):
+        self.assertTrue(self.builder.is_valid())
+        self.assertEqual(self.survey, self.builder.build())
+
+    def test_span_tracks_edits(self):
+        builder = self.builder
+        builder.add_question(
+            Question(msg="question3", responses=[Response(msg="", score=1)])
+        )
+        builder.add_response(0, Response(msg="response6", score=-2))
+        builder.remove_response(2, 1)
+        builder.remove_question(1)
+        self.assertEqual(
+            Survey._calculate_question_span(builder.questions), builder.span
+        )
+
+    def test_span_tracks_negative_indices(self):
+        builder = self.builder
+        for index in (-1, -10, 10, 0):
+            builder.add_question(
+                Question(msg="", responses=[Response(msg="", score=index)]),
+                index=index,
+            )
+            self.assertEqual(
+                Survey._calculate_question_span(builder.questions),
+                builder.span,
+            )
+        self.assertEqual(-1, builder.questions[-3].responses[0].score)
+        builder.add_response(-1, Response(msg="", score=50), index=-1)
+        builder.remove_question(-2)
+        builder.remove_response(-3, -1)
+        self.assertEqual(
+            Survey._calculate_question_span(builder.questions), builder.span
+        )
+
+    def test_ranges_revalidated(self):
+        builder = self.builder
+        builder.remove_range(1)
+        self.assertRaises(RangeError, builder.validate)
+        builder.add_range(OpenRange(msg="medium", lower=7, higher=9))
+        self.assertTrue(builder.is_valid())
+        # The highest answer grows beyond the last range.
+        builder.add_response(2, Response(msg="response6", score=6))
+        self.assertRaises(RangeError, builder.validate)
+        builder.remove_range(2)
+        builder.add_range(OpenRange(msg="high", lower=9, higher=11))
+        self.assertEqual(
+            Survey(
+                questions=list(builder.questions), ranges=list(builder.ranges)
+            ),
+            builder.build(),
+        )
+
+    def test_remove_negative_indices(self):
+        builder = self.builder
+        builder.add_range(OpenRange(msg="top", lower=10, higher=11))
+        builder.remove_range(-1)
+        self.assertTrue(builder.is_valid())
+        # [0, 7), [7, 9), [9, 10) without [7, 9) is disconnected.
+        builder.remove_range(-2)
+        self.assertFalse(builder.is_valid())
+        self.assertRaises(RangeError, builder.validate)
+        builder.add_range(OpenRange(msg="medium", lower=7, higher=9))
+        self.assertTrue(builder.is_valid())
+        self.assertRaises(IndexError, builder.remove_range, -4)
+        self.assertRaises(IndexError, builder.remove_question, 3)
+        builder.remove_response(-1, -1)
+        builder.remove_question(-3)
+        self.assertEqual(
+            Survey._calculate_question_span(builder.questions), builder.span
+        )
+        self.assertEqual(
+            ["question1", "question2"], [q.msg for q in builder.questions]
+        )
+
+    def test_build_is_detached(self):
+        survey = self.builder.build()
+        self.builder.add_response(0, Response(msg="response6", score=0))
+        self.assertEqual(2, len(survey.questions[0].responses))
+
+    def test_invalid_edits(self):
+        builder = SurveyBuilder()
+        self.assertRaises(SurveyError, builder.validate)
+        builder.add_question(self.survey.questions[0])
+        self.assertRaises(SurveyError, builder.validate)
+        builder.remove_response(0, 1)
+        self.assertRaises(QuestionError, builder.remove_response, 0, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
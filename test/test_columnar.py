@@ -0,0 +1,89 @@
+import os
+import shutil
+import unittest
+
+from pysurvey import (
+    ColumnarArchive,
+    NpyColumn,
+    NpyWriter,
+    SurveyError,
+    export_columns,
+)
+from pysurvey.logic.respondee import Respondee, RespondeeSurvey
+from pysurvey.logic.survey import make_dummy_survey
+
+
+class TestColumnar(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.path = os.path.splitext(__file__)[0] + "_columns"
+        cls.survey = make_dummy_survey()
+        cls.rows = [[0, 0, 0], [1, 1, 1], [1, 0, 1], [0, 1, 1]]
+
+    def test_npy_roundtrip(self):
+        os.makedirs(self.path, exist_ok=True)
+        path = os.path.join(self.path, "values.npy")
+        with NpyWriter(path=path, typecode="q", buffer_size=3) as writer:
+            writer.extend(range(-5, 5))
+        with NpyColumn(path) as column:
+            self.assertEqual(list(range(-5, 5)), list(column))
+            self.assertEqual(10, len(column))
+
+    def test_export_and_load(self):
+        records = [
+            RespondeeSurvey(
+                respondee=Respondee(),
+                survey=self.survey,
+                responses=self.rows[0],
+            ),
+            *self.rows[1:],
+        ]
+        n = export_columns(
+            directory=self.path, survey=self.survey, records=records
+        )
+        self.assertEqual(len(self.rows), n)
+        with ColumnarArchive(self.path) as archive:
+            self.assertIn("total", archive.columns)
+            self.assertEqual([6, 9, 8, 8], list(archive["total"]))
+            self.assertEqual([0, 2, 1, 1], list(archive["range"]))
+            for i in range(len(self.survey.questions)):
+                self.assertEqual(
+                    [row[i] for row in self.rows], list(archive.question(i))
+                )
+            self.assertEqual("B", archive.question(0).typecode)
+            self.assertRaises(KeyError, lambda: archive["missing"])
+
+    def test_bad_record_keeps_columns_aligned(self):
+        record = RespondeeSurvey(
+            respondee=Respondee(), survey=self.survey, responses=[0, 0, 0]
+        )
+        record.responses.pop()
+        with self.assertRaises(SurveyError):
+            export_columns(
+                directory=self.path,
+                survey=self.survey,
+                records=[self.rows[0], record],
+            )
+        with ColumnarArchive(self.path) as archive:
+            self.assertEqual(
+                {1}, {len(archive[name]) for name in archive.columns}
+            )
+
+    def test_numpy_compatible(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        export_columns(
+            directory=self.path, survey=self.survey, records=self.rows
+        )
+        totals = np.load(os.path.join(self.path, "total.npy"), mmap_mode="r")
+        self.assertEqual([6, 9, 8, 8], totals.tolist())
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
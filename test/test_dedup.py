@@ -0,0 +1,98 @@
+import json
+import os
+import unittest
+
+from pysurvey import (
+    BloomFilter,
+    DuplicateFilter,
+    OpenRange,
+    ScalableBloomFilter,
+    survey_fingerprint,
+)
+from pysurvey.logic.respondee import Respondee, RespondeeSurvey
+from pysurvey.logic.survey import make_dummy_survey
+
+
+class TestDedup(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.path = os.path.splitext(__file__)[0] + ".bloom"
+        cls.survey = make_dummy_survey()
+
+    def _record(self, name: str, responses: list[int]) -> RespondeeSurvey:
+        return RespondeeSurvey(
+            respondee=Respondee(name=name, email=f"{name}@example.com"),
+            survey=self.survey,
+            responses=responses,
+        )
+
+    def test_bloom_filter(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        keys = [str(i).encode() for i in range(1000)]
+        # A new key is only reported as present by a false positive.
+        self.assertLess(sum(bloom.add(key) for key in keys), 30)
+        self.assertTrue(all(key in bloom for key in keys))
+        false_positives = sum(
+            str(i).encode() in bloom for i in range(1000, 11_000)
+        )
+        self.assertLess(false_positives, 300)
+
+    def test_scalable_bloom_filter_grows(self):
+        bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.001)
+        keys = [str(i).encode() for i in range(1000)]
+        false_positives = sum(bloom.add(key) for key in keys)
+        self.assertLess(false_positives, 5)
+        self.assertTrue(all(bloom.add(key) for key in keys))
+        self.assertGreater(len(bloom.filters), 1)
+        self.assertEqual(1000 - false_positives, len(bloom))
+
+    def test_duplicates(self):
+        dedup = DuplicateFilter(initial_capacity=10)
+        record = self._record("a", [0, 1, 0])
+        self.assertFalse(dedup.is_duplicate(record))
+        self.assertTrue(dedup.is_duplicate(self._record("a", [0, 1, 0])))
+        self.assertTrue(dedup.is_duplicate(json.loads(record.to_json())))
+        self.assertFalse(dedup.is_duplicate(self._record("a", [0, 1, 1])))
+        self.assertFalse(dedup.is_duplicate(self._record("b", [0, 1, 0])))
+
+    def test_same_answers_to_other_survey(self):
+        dedup = DuplicateFilter(initial_capacity=10)
+        record = self._record("a", [0, 1, 0])
+        other = RespondeeSurvey(
+            respondee=record.respondee,
+            survey=self.survey.with_ranges(
+                [OpenRange(msg="all", lower=0, higher=10)]
+            ),
+            responses=[0, 1, 0],
+        )
+        self.assertFalse(dedup.is_duplicate(record))
+        self.assertFalse(dedup.is_duplicate(other))
+        self.assertTrue(
+            dedup.is_duplicate(
+                other, fingerprint=survey_fingerprint(other.survey)
+            )
+        )
+
+    def test_persistence(self):
+        records = [self._record(str(i), [i % 2, 0, 1]) for i in range(50)]
+        with DuplicateFilter(path=self.path, initial_capacity=10) as dedup:
+            for record in records:
+                dedup.is_duplicate(record)
+        restored = DuplicateFilter(path=self.path)
+        self.assertEqual(50, len(restored))
+        self.assertTrue(all(restored.is_duplicate(r) for r in records))
+        DuplicateFilter(path=self.path, initial_capacity=10)
+        self.assertRaises(
+            ValueError, DuplicateFilter, path=self.path, initial_capacity=20
+        )
+        self.assertRaises(
+            ValueError, DuplicateFilter, path=self.path, error_rate=0.1
+        )
+
+    def tearDown(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
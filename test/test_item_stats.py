@@ -0,0 +1,82 @@
+import unittest
+from statistics import correlation, covariance, variance
+
+from pysurvey import ItemStatistics, SurveyError
+from pysurvey.logic.simulation import random_survey, response_stream
+
+
+class TestItemStatistics(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.survey = random_survey(seed=9, n_questions=6, scores=(0, 4))
+        cls.rows = list(response_stream(survey=cls.survey, seed=10, n=500))
+        cls.scores = [
+            [q.responses[r].score for q, r in zip(cls.survey.questions, row)]
+            for row in cls.rows
+        ]
+        cls.columns = [list(column) for column in zip(*cls.scores)]
+
+    def _assert_matches(self, stats: ItemStatistics):
+        k = len(self.columns)
+        covariances = stats.covariance()
+        for i in range(k):
+            for j in range(k):
+                self.assertAlmostEqual(
+                    covariance(self.columns[i], self.columns[j]),
+                    covariances[i][j],
+                )
+        totals = [sum(row) for row in self.scores]
+        for i, r in enumerate(stats.item_total_correlations()):
+            rest = [t - x for t, x in zip(totals, self.columns[i])]
+            self.assertAlmostEqual(correlation(self.columns[i], rest), r)
+        for i, r in enumerate(stats.item_total_correlations(corrected=False)):
+            self.assertAlmostEqual(correlation(self.columns[i], totals), r)
+        alpha = (
+            k
+            / (k - 1)
+            * (
+                1
+                - sum(variance(column) for column in self.columns)
+                / variance(totals)
+            )
+        )
+        self.assertAlmostEqual(alpha, stats.cronbach_alpha())
+
+    def test_single_rows(self):
+        stats = ItemStatistics.for_survey(self.survey)
+        for row in self.rows:
+            stats.update_responses(row)
+        self._assert_matches(stats)
+
+    def test_batches_and_merge(self):
+        shards = [ItemStatistics.for_survey(self.survey) for _ in range(3)]
+        shards[0].update_responses_batch(self.rows[:100])
+        shards[0].update_responses_batch(self.rows[100:150])
+        shards[1].update_responses_batch(self.rows[150:400])
+        for row in self.rows[400:]:
+            shards[2].update_responses(row)
+        shards[0].merge(shards[1])
+        shards[0].merge(shards[2])
+        self.assertEqual(len(self.rows), shards[0].n)
+        self._assert_matches(shards[0])
+
+    def test_numerically_stable(self):
+        stats = ItemStatistics(n_items=2)
+        offset = 1e9
+        for x in range(1000):
+            stats.update([offset + x % 3, offset - x % 3])
+        self.assertAlmostEqual(
+            variance([x % 3 for x in range(1000)]), stats.variances()[0]
+        )
+        self.assertAlmostEqual(-1.0, stats.item_total_correlations()[0])
+
+    def test_errors(self):
+        stats = ItemStatistics(n_items=2)
+        self.assertRaises(SurveyError, stats.update, [1.0])
+        self.assertRaises(SurveyError, stats.covariance)
+        self.assertRaises(SurveyError, stats.update_responses, [0, 0])
+        self.assertRaises(SurveyError, stats.merge, ItemStatistics(n_items=3))
+
+
+if __name__ == "__main__":
+    unittest.main()
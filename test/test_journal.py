@@ -0,0 +1,103 @@
+import os
+import shutil
+import unittest
+from unittest import mock
+
+from pysurvey import Journal, JournalError, read_journal
+from pysurvey.logic.journal import list_segments
+from pysurvey.logic.respondee import Respondee, RespondeeSurvey
+from pysurvey.logic.survey import make_dummy_survey
+
+
+class TestJournal(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.survey = make_dummy_survey()
+        cls.records = [
+            RespondeeSurvey(
+                respondee=Respondee(name=f"respondee{i}", age=20 + i),
+                survey=cls.survey,
+                responses=[i % 2, (i // 2) % 2, (i // 4) % 2],
+            )
+            for i in range(8)
+        ]
+
+    def setUp(self) -> None:
+        self.path = os.path.splitext(__file__)[0] + "_journal"
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_roundtrip(self):
+        with Journal(self.path, commit_every=3) as journal:
+            for record in self.records:
+                journal.append(record)
+        self.assertEqual(self.records, list(read_journal(self.path)))
+
+    def test_recover_torn_record(self):
+        with Journal(self.path, commit_interval_ms=0) as journal:
+            for record in self.records[:5]:
+                journal.append(record)
+        (segment,) = list_segments(self.path, prefix="journal")
+        with open(segment, "ab") as f:
+            f.write(self.records[5].to_json().encode()[:40])
+        self.assertEqual(self.records[:5], list(read_journal(self.path)))
+        with Journal(self.path, commit_interval_ms=0) as journal:
+            for record in self.records[5:]:
+                journal.append(record)
+        self.assertEqual(self.records, list(read_journal(self.path)))
+
+    def test_multiline_payload_rejected(self):
+        with Journal(self.path, commit_interval_ms=0) as journal:
+            journal.append(self.records[0])
+            self.assertRaises(JournalError, journal.append, '{"a":\n1}')
+            for record in self.records[1:]:
+                journal.append(record)
+        with Journal(self.path, commit_interval_ms=0):
+            pass
+        self.assertEqual(self.records, list(read_journal(self.path)))
+
+    def test_corrupt_record_not_truncated(self):
+        with Journal(self.path, commit_interval_ms=0) as journal:
+            for record in self.records:
+                journal.append(record)
+        (segment,) = list_segments(self.path, prefix="journal")
+        with open(segment, "r+b") as f:
+            f.seek(20)
+            f.write(b"X")
+        size = os.path.getsize(segment)
+        self.assertRaises(JournalError, Journal, self.path)
+        self.assertRaises(JournalError, list, read_journal(self.path))
+        self.assertEqual(size, os.path.getsize(segment))
+
+    def test_rotate_segments(self):
+        size = len(self.records[0].to_json()) * 2 + 100
+        with Journal(self.path, segment_size=size) as journal:
+            for record in self.records:
+                journal.append(record)
+        self.assertEqual(4, len(list_segments(self.path, prefix="journal")))
+        self.assertEqual(self.records, list(read_journal(self.path)))
+
+    def test_new_segments_are_durable(self):
+        size = len(self.records[0].to_json()) * 2 + 100
+        with mock.patch(
+            "pysurvey.logic.journal.fsync_directory"
+        ) as fsync_directory:
+            with Journal(self.path, segment_size=size) as journal:
+                for record in self.records:
+                    journal.append(record)
+            # The first segment and the three rotated ones.
+            self.assertEqual(4, fsync_directory.call_count)
+            with Journal(self.path):
+                pass
+            self.assertEqual(4, fsync_directory.call_count)
+
+    def test_append_after_close(self):
+        journal = Journal(self.path)
+        journal.close()
+        self.assertRaises(JournalError, journal.append, self.records[0])
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
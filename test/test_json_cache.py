@@ -0,0 +1,122 @@
+import json
+import pickle
+import unittest
+from dataclasses import asdict
+from unittest import mock
+
+from pysurvey import Question, Response
+from pysurvey.logic import json_serializable
+from pysurvey.logic.respondee import Respondee, RespondeeSurvey
+from pysurvey.logic.survey import Survey, make_dummy_survey
+
+
+class TestJsonCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.survey = make_dummy_survey()
+        self.records = [
+            RespondeeSurvey(
+                respondee=Respondee(name=f"name{i}", age=i),
+                survey=self.survey,
+                responses=[i % 2, 0, 1],
+            )
+            for i in range(3)
+        ]
+
+    def tearDown(self) -> None:
+        for instance in [self.survey, *self.records]:
+            instance.disable_json_cache()
+        self.assertEqual({}, json_serializable._caches)
+
+    def assertSerializes(self, instance):
+        self.assertEqual(json.dumps(asdict(instance)), instance.to_json())
+
+    def test_disabled_by_default(self):
+        self.assertEqual({}, json_serializable._caches)
+        self.assertIs(RespondeeSurvey, type(self.records[0]))
+        self.assertSerializes(self.records[0])
+
+    def test_identical_output(self):
+        for record in self.records:
+            record.enable_json_cache()
+            self.assertSerializes(record)
+            # Served from the cache the second time.
+            self.assertIs(record.to_json(), record.to_json())
+        self.assertEqual(
+            self.survey, Survey.from_json(json.loads(self.survey.to_json()))
+        )
+
+    def test_shared_child_is_spliced(self):
+        survey_text = self.survey.enable_json_cache().to_json()
+        with (
+            mock.patch.object(
+                json_serializable, "_snapshot", side_effect=AssertionError
+            ),
+            mock.patch.object(
+                json_serializable, "_unchanged", side_effect=AssertionError
+            ),
+        ):
+            for record in self.records:
+                self.assertIn(survey_text, record.to_json())
+                self.assertSerializes(record)
+        self.assertIs(survey_text, self.survey.to_json())
+
+    def test_field_assignment_invalidates(self):
+        record = self.records[0].enable_json_cache()
+        record.to_json()
+        record.responses = [1, 1, 1]
+        record.score = 9
+        self.assertSerializes(record)
+        self.assertIn('"score": 9', record.to_json())
+
+    def test_nested_mutation_invalidates(self):
+        record = self.records[0].enable_json_cache()
+        record.to_json()
+        question = self.survey.questions[0]
+        question.msg = "changed"
+        self.assertSerializes(record)
+        question.responses[0] = Response(msg="replaced", score=0)
+        self.assertSerializes(record)
+        self.survey.ranges.append(self.survey.ranges[-1])
+        self.assertSerializes(record)
+        record.responses.append(0)
+        self.assertSerializes(record)
+        del record.responses[-1]
+        self.assertSerializes(record)
+
+    def test_attached_objects_are_tracked(self):
+        record = self.records[0].enable_json_cache()
+        record.to_json()
+        survey = make_dummy_survey()
+        record.survey = survey
+        self.assertSerializes(record)
+        survey.questions[0].msg = "X"
+        self.assertSerializes(record)
+        question = Question(msg="new", responses=[Response(msg="", score=0)])
+        survey.questions = survey.questions + [question]
+        self.assertSerializes(record)
+        question.msg = "Y"
+        self.assertSerializes(record)
+        question.responses.append(Response(msg="", score=1))
+        self.assertSerializes(record)
+
+    def test_untracked_containers_are_compared(self):
+        record = self.records[0].enable_json_cache()
+        responses = [[0], 0, 1]
+        record.responses = responses
+        record.to_json()
+        responses[0].append(1)
+        self.assertSerializes(record)
+
+    def test_pickle(self):
+        record = self.records[0].enable_json_cache()
+        record.to_json()
+        copy = pickle.loads(pickle.dumps(record))
+        self.assertIs(RespondeeSurvey, type(copy))
+        self.assertIs(Survey, type(copy.survey))
+        self.assertIs(list, type(copy.responses))
+        self.assertEqual(record, copy)
+        self.assertEqual(record.to_json(), copy.to_json())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from pysurvey import (
+    LabelIndex,
+    OpenRange,
+    Question,
+    QuestionError,
+    Response,
+    Survey,
+)
+
+
+class TestLabelIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.survey = Survey(
+            questions=[
+                Question(
+                    msg="How are you doing?",
+                    responses=[
+                        Response(msg="Good", score=5),
+                        Response(msg="Ok", score=3),
+                        Response(msg="Bad", score=1),
+                    ],
+                ),
+                Question(
+                    msg="Have you slept more than 7 hours?",
+                    responses=[
+                        Response(msg="Yes", score=5),
+                        Response(msg="No", score=1),
+                    ],
+                ),
+            ],
+            ranges=[OpenRange(msg="All", lower=2, higher=11)],
+        )
+
+    def test_lookup_exact(self):
+        index = LabelIndex(self.survey)
+        self.assertEqual(1, index.lookup(0, "Ok"))
+        self.assertEqual(1, index.lookup(1, "No"))
+        self.assertIsNone(index.get(0, "ok"))
+        self.assertRaises(QuestionError, index.lookup, 0, "ok")
+
+    def test_lookup_normalized(self):
+        index = LabelIndex(self.survey, normalize=True)
+        self.assertEqual(2, index.lookup(0, "  BAD "))
+        self.assertEqual(0, index.lookup(1, "yes"))
+
+    def test_ingest(self):
+        index = LabelIndex(self.survey, normalize=True)
+        result = index.ingest(
+            [
+                ["Good", "Yes"],
+                ["ok", "maybe"],
+                ["Bad"],
+                ["great", "maybe"],
+                ["Bad", "No"],
+            ]
+        )
+        self.assertEqual([[0, 0], [2, 1]], result.rows)
+        self.assertEqual([1, 2, 3], result.rejected)
+        self.assertEqual({0: {"great": 1}, 1: {"maybe": 2}}, result.unknown)
+
+    def test_duplicate_labels(self):
+        survey = Survey(
+            questions=[
+                Question(
+                    msg="",
+                    responses=[
+                        Response(msg="Yes", score=0),
+                        Response(msg="yes ", score=1),
+                    ],
+                )
+            ],
+            ranges=[OpenRange(msg="", lower=0, higher=2)],
+        )
+        LabelIndex(survey)
+        self.assertRaises(QuestionError, LabelIndex, survey, True)
+
+
+if __name__ == "__main__":
+    unittest.main()
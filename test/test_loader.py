@@ -0,0 +1,65 @@
+import json
+import os
+import shutil
+import unittest
+
+from pysurvey import RangeError, load_surveys, survey_fingerprint
+from pysurvey.logic.simulation import random_survey
+
+
+class TestLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.path = os.path.splitext(__file__)[0] + "_surveys"
+        shutil.rmtree(cls.path, ignore_errors=True)
+        os.makedirs(cls.path)
+        cls.surveys = [random_survey(seed=seed) for seed in range(5)]
+        for i, survey in enumerate(cls.surveys):
+            survey.write_json(os.path.join(cls.path, f"survey{i}.json"))
+        cls.surveys[0].write_json(os.path.join(cls.path, "duplicate.json"))
+        invalid = json.loads(cls.surveys[1].to_json())
+        invalid["ranges"][0]["lower"] += 1
+        with open(os.path.join(cls.path, "invalid_ranges.json"), "w") as f:
+            json.dump(invalid, f)
+        with open(os.path.join(cls.path, "invalid_json.json"), "w") as f:
+            f.write("{")
+
+    def _check(self, parse_workers):
+        result = load_surveys(self.path, parse_workers=parse_workers)
+        self.assertEqual(
+            {survey_fingerprint(survey) for survey in self.surveys},
+            set(result.surveys),
+        )
+        for survey in self.surveys:
+            self.assertEqual(survey, result.surveys[survey_fingerprint(survey)])
+        self.assertEqual(
+            ["duplicate.json", "survey0.json"],
+            sorted(
+                path.name
+                for path in result.paths[survey_fingerprint(self.surveys[0])]
+            ),
+        )
+        errors = {path.name: e for path, e in result.errors.items()}
+        self.assertEqual(
+            {"invalid_json.json", "invalid_ranges.json"}, set(errors)
+        )
+        self.assertIsInstance(errors["invalid_ranges.json"], RangeError)
+        self.assertIsInstance(errors["invalid_json.json"], json.JSONDecodeError)
+
+    def test_load_in_process(self):
+        self._check(parse_workers=0)
+
+    def test_load_in_process_pool(self):
+        self._check(parse_workers=2)
+
+    def test_missing_file(self):
+        result = load_surveys([os.path.join(self.path, "missing.json")])
+        self.assertIsInstance(next(iter(result.errors.values())), OSError)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import unittest
+from bisect import bisect_left
+
+from pysurvey import RangeError, RankIndex
+from pysurvey.logic.simulation import random_survey, response_stream
+
+
+class TestRankIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.path = os.path.splitext(__file__)[0] + ".json"
+        cls.survey = random_survey(seed=7, n_questions=20)
+        cls.scores = [
+            cls.survey.score(row)
+            for row in response_stream(survey=cls.survey, seed=8, n=1000)
+        ]
+
+    def _index(self, scores) -> RankIndex:
+        index = RankIndex.from_survey(self.survey)
+        for score in scores:
+            index.add(score)
+        return index
+
+    def test_percentile_rank(self):
+        index = self._index(self.scores)
+        ordered = sorted(self.scores)
+        self.assertEqual(len(ordered), len(index))
+        for score in range(index.lower - 1, index.higher + 1):
+            self.assertEqual(
+                bisect_left(ordered, score), index.count_below(score)
+            )
+            self.assertAlmostEqual(
+                bisect_left(ordered, score) / len(ordered),
+                index.percentile_rank(score),
+            )
+            self.assertEqual(self.scores.count(score), index.count_at(score))
+
+    def test_out_of_span(self):
+        index = RankIndex(lower=0, higher=10)
+        self.assertEqual(0.0, index.percentile_rank(5))
+        self.assertRaises(RangeError, index.add, 10)
+        self.assertRaises(RangeError, index.add, -1)
+        self.assertRaises(RangeError, RankIndex, 0.5, 10)
+
+    def test_merge(self):
+        merged = self._index(self.scores[:400])
+        merged.merge(self._index(self.scores[400:]))
+        expected = self._index(self.scores)
+        self.assertEqual(expected.to_json(), merged.to_json())
+        self.assertRaises(RangeError, merged.merge, RankIndex(0, 1))
+
+    def test_save_and_load(self):
+        index = self._index(self.scores)
+        index.save(self.path)
+        self.assertEqual(index.to_json(), RankIndex.load(self.path).to_json())
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        if os.path.exists(cls.path):
+            os.remove(cls.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import shutil
+import unittest
+
+from pysurvey import (
+    ColumnarArchive,
+    OpenRange,
+    RangeError,
+    export_columns,
+    reband_columns,
+    reband_records,
+    reband_totals,
+)
+from pysurvey.logic.respondee import Respondee, RespondeeSurvey
+from pysurvey.logic.simulation import random_survey, response_stream
+from pysurvey.logic.survey import make_dummy_survey
+
+
+class TestReband(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.path = os.path.splitext(__file__)[0] + "_columns"
+        cls.survey = make_dummy_survey()
+        # The span of the dummy survey is [6, 10).
+        cls.ranges = [
+            OpenRange(msg="high", lower=8, higher=10),
+            OpenRange(msg="low", lower=6, higher=8),
+        ]
+        cls.rows = [[0, 0, 0], [1, 1, 1], [1, 0, 1], [0, 1, 1], [0, 0, 1]]
+
+    def test_reband_totals(self):
+        totals = [self.survey.score(row) for row in self.rows]
+        self.assertEqual(
+            [0, 1, 1, 1, 0],
+            list(reband_totals(self.survey, self.ranges, totals)),
+        )
+        self.assertRaises(
+            RangeError, reband_totals, self.survey, self.ranges, [10]
+        )
+
+    def test_reband_validates_ranges(self):
+        self.assertRaises(
+            RangeError,
+            reband_totals,
+            self.survey,
+            [OpenRange(msg="", lower=7, higher=10)],
+            [7],
+        )
+
+    def test_reband_matches_rescoring(self):
+        survey = random_survey(seed=5, n_questions=30, n_ranges=6)
+        ranges = random_survey(seed=5, n_questions=30, n_ranges=9).ranges
+        rebanded = survey.with_ranges(ranges)
+        rows = list(response_stream(survey=survey, seed=6, n=500))
+        totals = [survey.score(row) for row in rows]
+        self.assertEqual(
+            [rebanded.ranges.index(rebanded.get_range(t)) for t in totals],
+            list(reband_totals(survey, ranges, totals)),
+        )
+
+    def test_reband_records(self):
+        records = [
+            RespondeeSurvey(
+                respondee=Respondee(), survey=self.survey, responses=row
+            ).to_json()
+            for row in self.rows
+        ]
+        self.assertEqual(
+            ["low", "high", "high", "high", "low"],
+            [
+                range_.msg
+                for _, range_ in reband_records(
+                    self.survey, self.ranges, records
+                )
+            ],
+        )
+
+    def test_reband_columns(self):
+        export_columns(self.path, survey=self.survey, records=self.rows)
+        rebanded = reband_columns(self.path, self.survey, self.ranges)
+        with ColumnarArchive(self.path) as archive:
+            self.assertEqual(
+                ["low", "high", "high", "high", "low"],
+                [rebanded.ranges[i].msg for i in archive["range"]],
+            )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
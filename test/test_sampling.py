@@ -0,0 +1,60 @@
+import unittest
+from collections import Counter
+
+from pysurvey import ReservoirSampler, StratifiedSampler, by_range, by_response
+from pysurvey.logic.simulation import random_survey, response_stream
+
+
+class TestSampling(unittest.TestCase):
+    def test_reservoir_small_stream(self):
+        sampler = ReservoirSampler(k=10, seed=0)
+        sampler.extend(range(4))
+        self.assertEqual([0, 1, 2, 3], sampler.sample)
+
+    def test_reservoir_is_reproducible(self):
+        a, b = ReservoirSampler(k=10, seed=1), ReservoirSampler(k=10, seed=1)
+        a.extend(range(10_000))
+        b.extend(range(10_000))
+        self.assertEqual(a.sample, b.sample)
+        self.assertEqual(10, len(set(a.sample)))
+        self.assertEqual(10_000, a.seen)
+
+    def test_reservoir_is_uniform(self):
+        counts = Counter()
+        trials = 2000
+        for seed in range(trials):
+            sampler = ReservoirSampler(k=10, seed=seed)
+            sampler.extend(range(100))
+            counts.update(sampler.sample)
+        # Every item is expected in 10% of the samples, i.e. 200 times.
+        self.assertEqual(set(range(100)), set(counts))
+        for item, count in counts.items():
+            self.assertTrue(130 < count < 270, msg=(item, count))
+
+    def test_stratified(self):
+        survey = random_survey(seed=2)
+        rows = list(response_stream(survey=survey, seed=3, n=2000))
+        key = by_range(survey)
+        sampler = StratifiedSampler(k=25, key=key, seed=4)
+        sampler.extend(rows)
+        expected = Counter(key(row) for row in rows)
+        self.assertEqual(dict(expected), sampler.seen)
+        for stratum, sample in sampler.samples.items():
+            self.assertEqual(min(25, expected[stratum]), len(sample))
+            self.assertTrue(all(key(row) == stratum for row in sample))
+        # Samples do not depend on the order in which strata first appear.
+        reordered = StratifiedSampler(k=25, key=key, seed=4)
+        reordered.extend(sorted(rows, key=lambda row: -key(row)))
+        self.assertEqual(
+            {s: sorted(v) for s, v in sampler.samples.items()},
+            {s: sorted(v) for s, v in reordered.samples.items()},
+        )
+
+    def test_by_response(self):
+        sampler = StratifiedSampler(k=1, key=by_response(1), seed=0)
+        sampler.extend([{"responses": [0, i % 3]} for i in range(9)])
+        self.assertEqual({0, 1, 2}, set(sampler.samples))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from pysurvey.cli.main import main
+from pysurvey.cli.score import read_rows, score_stream
+from pysurvey.logic.survey import make_dummy_survey
+
+
+class TestScoreCli(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.survey = make_dummy_survey()
+        cls.rows = [[0, 0, 0], [1, 1, 1], [1, 0, 1]] * 10
+        cls.expected = [
+            (6, "low", None),
+            (9, "high", None),
+            (8, "medium", None),
+        ] * 10
+
+    def test_read_rows_jsonl(self):
+        stream = io.StringIO(
+            "[0, 0, 0]\n\n"
+            + json.dumps({"responses": [1, 1, 1]})
+            + "\nnot json\n"
+        )
+        rows = list(read_rows(stream=stream, format="jsonl"))
+        self.assertEqual([0, 0, 0], rows[0])
+        self.assertEqual([1, 1, 1], rows[1])
+        self.assertIsInstance(rows[2], Exception)
+
+    def test_read_rows_csv(self):
+        stream = io.StringIO("q0,q1,q2\n0,1,0\n1,x,1\n")
+        rows = list(read_rows(stream=stream, format="csv", header=True))
+        self.assertEqual([0, 1, 0], rows[0])
+        self.assertIsInstance(rows[1], Exception)
+
+    def test_score_stream_serial(self):
+        results = list(score_stream(survey=self.survey, rows=self.rows))
+        self.assertEqual(self.expected, results)
+
+    def test_score_stream_parallel_keeps_order(self):
+        results = list(
+            score_stream(
+                survey=self.survey, rows=self.rows, jobs=2, chunk_size=4
+            )
+        )
+        self.assertEqual(self.expected, results)
+
+    def test_score_stream_reports_bad_rows(self):
+        results = list(
+            score_stream(
+                survey=self.survey,
+                rows=[[0, 0], [0, 0, 2], [True, 0, 0], [0, 0, 0]],
+            )
+        )
+        self.assertIsNotNone(results[0][2])
+        self.assertIsNotNone(results[1][2])
+        self.assertIsNotNone(results[2][2])
+        self.assertEqual((6, "low", None), results[3])
+
+    def test_positive_options(self):
+        for option in ("--jobs", "--chunk-size"):
+            for value in ("0", "-1", "x"):
+                with self.subTest(option=option, value=value):
+                    with redirect_stderr(io.StringIO()):
+                        with self.assertRaises(SystemExit):
+                            main(["score", "survey.json", option, value])
+
+    def test_broken_pipe_is_quiet(self):
+        with tempfile.TemporaryDirectory() as directory:
+            survey = os.path.join(directory, "survey.json")
+            rows = os.path.join(directory, "rows.jsonl")
+            self.survey.write_json(survey)
+            with open(rows, "w") as f:
+                f.writelines("[0, 1, 0]\n" for _ in range(200_000))
+            process = subprocess.Popen(
+                [sys.executable, "-m", "pysurvey.cli.main", "score"]
+                + [survey, rows],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            self.assertTrue(process.stdout.readline())
+            process.stdout.close()
+            stderr = process.stderr.read().decode()
+            process.stderr.close()
+            process.wait()
+        self.assertNotIn("Traceback", stderr)
+        self.assertNotIn("BrokenPipeError", stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+from itertools import product
+
+from pysurvey import FrozenSurvey, RangeError, ShardedAggregator, SurveyError
+from pysurvey.logic.survey import make_dummy_survey
+
+
+class TestShared(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.survey = make_dummy_survey()
+        cls.frozen = FrozenSurvey.from_survey(cls.survey)
+        cls.rows = [list(row) for row in product(range(2), repeat=3)]
+
+    def test_frozen_matches_survey(self):
+        for row in self.rows:
+            score = self.survey.score(row)
+            self.assertEqual(score, self.frozen.score(row))
+            self.assertEqual(
+                self.survey.get_range(score).msg, self.frozen.get_range(score)
+            )
+        self.assertRaises(SurveyError, self.frozen.score, [0, 0])
+        self.assertRaises(SurveyError, self.frozen.score, [0, 0, 2])
+        self.assertRaises(SurveyError, self.frozen.score, [True, 0, 0])
+        self.assertRaises(SurveyError, self.survey.score, [True, 0, 0])
+        self.assertRaises(RangeError, self.frozen.range_index, 10)
+        self.assertRaises(RangeError, self.frozen.range_index, -1)
+
+    def test_frozen_is_immutable(self):
+        with self.assertRaises(FrozenInstanceError):
+            self.frozen.labels = ()
+
+    def test_sharded_aggregation(self):
+        aggregator = ShardedAggregator(self.frozen)
+        repeats = 250
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(aggregator.add, self.rows * repeats))
+        snapshot = aggregator.snapshot()
+        scores = [self.survey.score(row) for row in self.rows]
+        self.assertEqual(len(self.rows) * repeats, snapshot.count)
+        self.assertEqual(sum(scores) * repeats, snapshot.total)
+        self.assertEqual(
+            tuple(
+                repeats
+                * sum(self.frozen.range_index(score) == i for score in scores)
+                for i in range(len(self.frozen.labels))
+            ),
+            snapshot.range_counts,
+        )
+
+    def test_snapshots_hold_whole_records(self):
+        aggregator = ShardedAggregator(self.frozen)
+        row = self.rows[-1]
+        score = self.survey.score(row)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(lambda: [aggregator.add(row) for _ in range(5000)])
+                for _ in range(3)
+            ]
+            while not all(future.done() for future in futures):
+                snapshot = aggregator.snapshot()
+                self.assertEqual(snapshot.count * score, snapshot.total)
+                self.assertEqual(snapshot.count, sum(snapshot.range_counts))
+        self.assertEqual(15000, aggregator.snapshot().count)
+
+
+if __name__ == "__main__":
+    unittest.main()
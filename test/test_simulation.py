@@ -0,0 +1,54 @@
+import unittest
+from itertools import islice
+
+from pysurvey import Survey, random_survey, response_stream, simulate
+
+
+class TestSimulation(unittest.TestCase):
+    def test_random_survey_is_valid(self):
+        for seed in range(50):
+            survey = random_survey(seed=seed, n_questions=1 + seed % 7)
+            span = Survey._calculate_question_span(survey.questions)
+            self.assertEqual(span.lower, survey.ranges[0].lower)
+            self.assertEqual(span.higher, survey.ranges[-1].higher)
+
+    def test_random_survey_is_reproducible(self):
+        self.assertEqual(random_survey(seed=3), random_survey(seed=3))
+
+    def test_response_stream(self):
+        survey = random_survey(seed=1)
+        rows = list(response_stream(survey=survey, seed=2, n=100))
+        self.assertEqual(100, len(rows))
+        self.assertEqual(
+            rows, list(response_stream(survey=survey, seed=2, n=100))
+        )
+        for row in rows:
+            survey.score(row)
+        # A zero weight is never picked.
+        weights = [[0] + [1] * (len(q.responses) - 1) for q in survey.questions]
+        for row in islice(
+            response_stream(survey, seed=2, weights=weights), 100
+        ):
+            self.assertNotIn(0, row)
+
+    def test_simulate(self):
+        survey = random_survey(seed=4)
+        report = simulate(survey=survey, sessions=200, concurrency=4, seed=5)
+        self.assertEqual(200, report.sessions)
+        self.assertEqual(200, sum(report.range_counts.values()))
+        self.assertGreater(report.throughput, 0)
+        percentiles = report.latency_percentiles()
+        self.assertLessEqual(percentiles[50], percentiles[99])
+        again = simulate(
+            survey=survey,
+            sessions=200,
+            concurrency=2,
+            seed=5,
+            trace_memory=True,
+        )
+        self.assertEqual(report.range_counts, again.range_counts)
+        self.assertIsNotNone(again.memory_per_session)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import json
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError
+
+from pysurvey import OpenRange, Question, Response
+from pysurvey.logic.respondee import Respondee, RespondeeSurvey
+from pysurvey.logic.survey import make_dummy_survey
+
+
+class TestSlots(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.survey = make_dummy_survey()
+        cls.instances = [
+            OpenRange(msg="range", lower=0, higher=1),
+            Response(msg="response", score=1),
+            Question(msg="question", responses=[Response(msg="", score=0)]),
+            Respondee(name="name", age=30),
+            RespondeeSurvey(
+                respondee=Respondee(name="name"),
+                survey=cls.survey,
+                responses=[0, 1, 0],
+            ),
+        ]
+
+    def test_no_instance_dict(self):
+        for instance in self.instances:
+            with self.subTest(type(instance).__name__):
+                self.assertFalse(hasattr(instance, "__dict__"))
+
+    def test_frozen(self):
+        for instance, field in zip(
+            self.instances[:2] + self.instances[3:4], ("msg", "msg", "name")
+        ):
+            with self.subTest(type(instance).__name__):
+                with self.assertRaises(FrozenInstanceError):
+                    setattr(instance, field, "changed")
+
+    def test_json_and_pickle_roundtrip(self):
+        for instance in self.instances:
+            with self.subTest(type(instance).__name__):
+                cls = type(instance)
+                self.assertEqual(
+                    instance, cls.from_json(json.loads(instance.to_json()))
+                )
+                self.assertEqual(instance, pickle.loads(pickle.dumps(instance)))
+
+    def test_response_hash_matches_eq(self):
+        a = Response(msg="a", score=1)
+        b = Response(msg="b", score=1)
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+
+
+if __name__ == "__main__":
+    unittest.main()
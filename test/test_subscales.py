@@ -0,0 +1,128 @@
+import json
+import unittest
+
+from pysurvey import (
+    OpenRange,
+    Question,
+    RangeError,
+    Response,
+    Subscale,
+    Survey,
+    SurveyBuilder,
+    SurveyError,
+)
+
+
+def make_survey(**kwargs) -> Survey:
+    plain = kwargs.get("subscales") == []
+    questions = [
+        Question(
+            msg=f"question{i}",
+            responses=[
+                Response(
+                    msg="never", score=0, subscores=() if plain else (0, 0)
+                ),
+                Response(
+                    msg="sometimes",
+                    score=1,
+                    subscores=() if plain else (1, i % 2),
+                ),
+                Response(
+                    msg="often",
+                    score=2,
+                    subscores=() if plain else (2, 2 * (i % 2)),
+                ),
+            ],
+        )
+        for i in range(3)
+    ]
+    subscales = [
+        Subscale(
+            name="anxiety",
+            ranges=[
+                OpenRange(msg="high", lower=4, higher=7),
+                OpenRange(msg="low", lower=0, higher=4),
+            ],
+        ),
+        Subscale(
+            name="sleep", ranges=[OpenRange(msg="all", lower=0, higher=3)]
+        ),
+    ]
+    kwargs.setdefault("subscales", subscales)
+    return Survey(
+        questions=questions,
+        ranges=[OpenRange(msg="total", lower=0, higher=7)],
+        **kwargs,
+    )
+
+
+class TestSubscales(unittest.TestCase):
+    def test_score_subscales(self):
+        survey = make_survey()
+        scores = survey.score_subscales([2, 1, 2])
+        self.assertEqual(["anxiety", "sleep"], [s.name for s in scores])
+        self.assertEqual([5, 1], [s.score for s in scores])
+        self.assertEqual(["high", "all"], [s.range_.msg for s in scores])
+        self.assertEqual(5, survey.score([2, 1, 2]))
+        self.assertRaises(SurveyError, survey.score_subscales, [0, 0])
+        self.assertRaises(SurveyError, survey.score_subscales, [0, 3, 0])
+
+    def test_without_subscales(self):
+        survey = make_survey(subscales=[])
+        self.assertEqual([], survey.score_subscales([0, 0, 0]))
+        self.assertEqual(0, survey.score([0, 0, 0]))
+
+    def test_validation(self):
+        narrow = Subscale(name="sleep", ranges=[OpenRange("", 0, 2)])
+        with self.assertRaises(RangeError):
+            make_survey(subscales=[make_survey().subscales[0], narrow])
+        gap = Subscale(
+            name="anxiety",
+            ranges=[OpenRange("", 0, 3), OpenRange("", 4, 7)],
+        )
+        with self.assertRaises(RangeError):
+            make_survey(subscales=[gap, narrow])
+        with self.assertRaises(SurveyError):
+            make_survey(subscales=make_survey().subscales[:1])
+        with self.assertRaises(SurveyError):
+            Subscale(name="empty", ranges=[])
+
+    def test_json_roundtrip(self):
+        survey = make_survey()
+        self.assertEqual(survey, Survey.from_json(json.loads(survey.to_json())))
+        self.assertEqual(
+            survey.score_subscales([1, 1, 1]),
+            Survey.from_json(json.loads(survey.to_json())).score_subscales(
+                [1, 1, 1]
+            ),
+        )
+        # Surveys serialized before subscales existed still load.
+        legacy = json.loads(make_survey(subscales=[]).to_json())
+        del legacy["subscales"]
+        for question in legacy["questions"]:
+            for response in question["responses"]:
+                del response["subscores"]
+        self.assertEqual([], Survey.from_json(legacy).subscales)
+
+    def test_builder_roundtrip(self):
+        survey = make_survey()
+        builder = SurveyBuilder.from_survey(survey)
+        built = builder.build()
+        self.assertEqual(survey, built)
+        self.assertEqual(
+            survey.score_subscales([2, 1, 2]), built.score_subscales([2, 1, 2])
+        )
+        self.assertEqual(built, Survey.from_json(json.loads(built.to_json())))
+        # Subscores that break the subscale ranges or counts are caught.
+        builder.add_response(1, Response(msg="", score=0, subscores=(0, 5)))
+        self.assertRaises(RangeError, builder.validate)
+        builder.remove_response(1, -1)
+        builder.add_response(1, Response(msg="", score=0))
+        self.assertRaises(SurveyError, builder.build)
+        builder.remove_response(1, -1)
+        builder.set_subscales([])
+        self.assertRaises(SurveyError, builder.validate)
+
+
+if __name__ == "__main__":
+    unittest.main()
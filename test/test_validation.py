@@ -0,0 +1,71 @@
+import unittest
+
+from pysurvey import SurveyError, ValidationIssue, validate_rows
+from pysurvey.logic.respondee import Respondee, RespondeeSurvey
+from pysurvey.logic.survey import make_dummy_survey
+
+
+class TestValidation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.survey = make_dummy_survey()
+        cls.rows = [
+            [0, 1, 0],
+            [0, 1],
+            [0, 2, 0],
+            [0, "1", -1],
+            (1, 1, 1),
+            None,
+        ]
+
+    def test_validate_rows(self):
+        result = validate_rows(self.survey, self.rows)
+        self.assertEqual(bytearray([1, 0, 0, 0, 1, 0]), result.mask)
+        self.assertEqual(2, result.n_valid)
+        self.assertEqual([0, 4], result.valid_indices())
+        self.assertEqual(
+            [
+                (1, None, ValidationIssue.Length),
+                (2, 1, ValidationIssue.Bounds),
+                (3, 1, ValidationIssue.Type),
+                (3, 2, ValidationIssue.Bounds),
+                (5, None, ValidationIssue.Length),
+            ],
+            [(e.row, e.column, e.issue) for e in result.errors],
+        )
+        self.assertEqual([[0, 1, 0], (1, 1, 1)], list(result.select(self.rows)))
+
+    def test_max_errors(self):
+        result = validate_rows(self.survey, self.rows, max_errors=2)
+        self.assertEqual(2, len(result.errors))
+        self.assertEqual(2, result.n_valid)
+
+    def test_validate_array(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        rows = np.array([[0, 1, 0], [0, 2, 0], [1, 1, -1], [1, 1, 1]])
+        result = validate_rows(self.survey, rows)
+        self.assertEqual(bytearray([1, 0, 0, 1]), result.mask)
+        self.assertEqual(
+            [(1, 1), (2, 2)], [(e.row, e.column) for e in result.errors]
+        )
+        result = validate_rows(self.survey, rows[:, :2])
+        self.assertEqual(0, result.n_valid)
+        self.assertEqual(4, len(result.errors))
+
+    def test_respondee_survey_raises(self):
+        for responses in ([0, 2, 0], [0, 1]):
+            with self.subTest(responses):
+                self.assertRaises(
+                    SurveyError,
+                    RespondeeSurvey,
+                    respondee=Respondee(),
+                    survey=self.survey,
+                    responses=responses,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()